@@ -1,21 +1,24 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import requests
 import time
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import quote
 import re
-from collections import Counter, defaultdict
+import string
+from collections import Counter, defaultdict, deque
 import json
-from datetime import datetime, timedelta
-import io
+from datetime import datetime, timedelta, date
+import importlib.util
+import tempfile
+import weakref
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 import base64
 import os
+import sys
 import random
 import seaborn as sns
 import matplotlib.pyplot as plt
@@ -28,7 +31,31 @@ import httpx
 import asyncio
 from contextlib import asynccontextmanager
 import diskcache
-from functools import wraps
+import cachetools
+from functools import wraps, lru_cache
+
+# Optional JIT compilation for numeric kernels
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op replacement for numba.njit when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Prefer the streaming xlsxwriter engine for Excel reports
+EXCEL_ENGINE = 'xlsxwriter' if importlib.util.find_spec('xlsxwriter') else 'openpyxl'
+
+# orjson parses API payloads several times faster than the stdlib json module
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 # Import translation manager
 from languages import translation_manager
@@ -132,6 +159,13 @@ def cached_extract_authors(openalex_data):
     _author_extraction_cache[cache_key] = result
     return result
 
+def get_publication_year(cr):
+    """Publication year from Crossref metadata, or None if it is missing"""
+    try:
+        return cr['published']['date-parts'][0][0]
+    except (KeyError, IndexError, TypeError):
+        return None
+
 def is_valid_doi_cached(doi):
     """Cached DOI validation"""
     if doi in _doi_validity_cache:
@@ -165,20 +199,24 @@ def parallel_metadata_loading(doi, state):
             'openalex': future_openalex.result()
         }
 
-def parallel_metrics_calculation(analyzed_metadata, citing_metadata, state, journal_issn):
+def parallel_metrics_calculation(analyzed_metadata, citing_metadata, state, journal_issn, analyzed_citings=None):
     """Parallel calculation of all metrics"""
+    # Citing works of each analyzed article are looked up once for all citation analytics
+    if analyzed_citings is None:
+        analyzed_citings = collect_analyzed_citings(analyzed_metadata, state)
+    
     with ThreadPoolExecutor(max_workers=4) as executor:
         # Basic metrics
-        future_basic = executor.submit(enhanced_stats_calculation, analyzed_metadata, citing_metadata, state)
+        future_basic = executor.submit(enhanced_stats_calculation, analyzed_metadata, citing_metadata, state, analyzed_citings)
         
         # Fast metrics
         future_fast = executor.submit(calculate_all_fast_metrics, analyzed_metadata, citing_metadata, state, journal_issn)
         
         # Citation timing
-        future_timing = executor.submit(calculate_citation_timing, analyzed_metadata, state)
+        future_timing = executor.submit(calculate_citation_timing, analyzed_metadata, state, analyzed_citings)
         
         # Overlap analysis
-        future_overlap = executor.submit(analyze_overlaps, analyzed_metadata, citing_metadata, state)
+        future_overlap = executor.submit(analyze_overlaps, analyzed_metadata, citing_metadata, state, analyzed_citings)
         
         return {
             'basic': future_basic.result(),
@@ -281,7 +319,7 @@ def parallel_analyses(analyzed_metadata, citing_metadata, state, citation_timing
 
 def parallel_title_keywords_analysis(analyzed_metadata, citing_metadata):
     """Parallel analysis of title keywords"""
-    analyzer = TitleKeywordsAnalyzer()
+    analyzer = get_title_keywords_analyzer()
     
     analyzed_titles = extract_titles_from_metadata(analyzed_metadata)
     citing_titles = extract_titles_from_metadata(citing_metadata)
@@ -393,9 +431,10 @@ def progressive_analysis(analyzed_metadata, citing_metadata, state, journal_issn
     basic_metrics = calculate_basic_metrics(analyzed_metadata, citing_metadata)
     
     # Phase 2: Start background tasks for advanced metrics
+    analyzed_citings = collect_analyzed_citings(analyzed_metadata, state)
     with ThreadPoolExecutor(max_workers=3) as executor:
-        future_advanced = executor.submit(calculate_advanced_metrics, analyzed_metadata, citing_metadata, state)
-        future_timing = executor.submit(calculate_citation_timing, analyzed_metadata, state)
+        future_advanced = executor.submit(calculate_advanced_metrics, analyzed_metadata, citing_metadata, state, analyzed_citings)
+        future_timing = executor.submit(calculate_citation_timing, analyzed_metadata, state, analyzed_citings)
         future_fast = executor.submit(calculate_all_fast_metrics, analyzed_metadata, citing_metadata, state, journal_issn)
     
     return {
@@ -405,11 +444,13 @@ def progressive_analysis(analyzed_metadata, citing_metadata, state, journal_issn
         'future_fast': future_fast
     }
 
-def calculate_advanced_metrics(analyzed_metadata, citing_metadata, state):
+def calculate_advanced_metrics(analyzed_metadata, citing_metadata, state, analyzed_citings=None):
     """Calculate advanced metrics (can be slow)"""
     # Implementation of advanced metrics calculation
-    enhanced_stats = enhanced_stats_calculation(analyzed_metadata, citing_metadata, state)
-    overlap_details = analyze_overlaps(analyzed_metadata, citing_metadata, state)
+    if analyzed_citings is None:
+        analyzed_citings = collect_analyzed_citings(analyzed_metadata, state)
+    enhanced_stats = enhanced_stats_calculation(analyzed_metadata, citing_metadata, state, analyzed_citings)
+    overlap_details = analyze_overlaps(analyzed_metadata, citing_metadata, state, analyzed_citings)
     
     return {
         'enhanced_stats': enhanced_stats,
@@ -652,6 +693,87 @@ class CacheManager:
         except Exception:
             return {'size': 0, 'directory': 'unknown', 'ttl': self.ttl}
 
+class MemoryTTLCache:
+    """Bounded in-memory cache with per-entry expiry, safe to share between worker threads"""
+    
+    def __init__(self, maxsize: int = 20000, ttl: int = 3600):
+        self.cache = cachetools.TTLCache(maxsize=maxsize, ttl=ttl)
+        self.lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        with self.lock:
+            return self.cache.get(key, default)
+    
+    def __getitem__(self, key):
+        with self.lock:
+            return self.cache[key]
+    
+    def __setitem__(self, key, value):
+        with self.lock:
+            self.cache[key] = value
+    
+    def __contains__(self, key):
+        with self.lock:
+            return key in self.cache
+    
+    def __len__(self):
+        with self.lock:
+            return len(self.cache)
+
+class PersistentCache:
+    """Disk cache with an in-memory front: hits after the first read skip SQLite and unpickling.
+    Once the front is full, TinyLFU-style admission keeps one-shot keys on disk only, so they
+    cannot push out frequently used entries (e.g. heavily cited works)."""
+    
+    def __init__(self, disk, maxsize: int = 20000, ttl: int = 3600, expire: Optional[int] = None):
+        self.disk = disk
+        self.memory = MemoryTTLCache(maxsize=maxsize, ttl=ttl)
+        # Lifetime of disk entries in seconds (None keeps them until evicted)
+        self.expire = expire
+        self.maxsize = maxsize
+        self.frequency = Counter()
+        self.accesses = 0
+        self.frequency_lock = threading.Lock()
+    
+    def record_access(self, key):
+        """Count an access and return the key's recent frequency"""
+        with self.frequency_lock:
+            self.frequency[key] += 1
+            count = self.frequency[key]
+            self.accesses += 1
+            # Halve all counts periodically so past popularity fades and the counter stays bounded
+            if self.accesses >= 10 * self.maxsize:
+                self.frequency = Counter({k: c // 2 for k, c in self.frequency.items() if c > 1})
+                self.accesses //= 2
+            return count
+    
+    def admit(self, key, value):
+        if len(self.memory) < self.maxsize or key in self.memory or self.record_access(key) > 1:
+            self.memory[key] = value
+    
+    def get(self, key, default=None):
+        value = self.memory.get(key)
+        if value is not None:
+            return value
+        value = self.disk.get(key)
+        if value is None:
+            return default
+        self.admit(key, value)
+        return value
+    
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+    
+    def __setitem__(self, key, value):
+        self.disk.set(key, value, expire=self.expire)
+        self.admit(key, value)
+    
+    def __contains__(self, key):
+        return key in self.memory or key in self.disk
+
 # =============================================================================
 # ERROR HANDLING AND RETRY MECHANISM (ORIGINAL)
 # =============================================================================
@@ -664,6 +786,12 @@ class APIError(AnalysisError):
     """Exception for API-related errors"""
     pass
 
+class IncompleteResultError(APIError):
+    """Exception for a fetch that failed part-way; what was fetched is kept in .partial"""
+    def __init__(self, message, partial=None):
+        super().__init__(message)
+        self.partial = partial
+
 class DataValidationError(AnalysisError):
     """Exception for data validation errors"""
     pass
@@ -795,10 +923,10 @@ class APIClientBase:
     def _make_request(self, url: str, headers: Optional[Dict] = None, timeout: int = 30) -> Optional[Dict]:
         """Make HTTP request with retry logic"""
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
+            response = HTTP_CLIENT.get(url, headers=headers, timeout=timeout)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return json_loads(response.content)
+        except httpx.HTTPError as e:
             self.logger.error(f"Request failed for {url}: {str(e)}")
             raise APIError(f"Failed to fetch data from {url}: {str(e)}")
 
@@ -1224,16 +1352,40 @@ class MetricsCalculator:
 # STATE MANAGEMENT (ORIGINAL)
 # =============================================================================
   
+# Citing lists change as new papers appear, so stored ones are refreshed daily
+CITING_CACHE_TTL = 24 * 3600
+# OpenAlex records carry cited_by_count, which also decides whether citing works are fetched at all
+OPENALEX_CACHE_TTL = 24 * 3600
+
+@st.cache_resource(show_spinner=False)
+def get_disk_caches():
+    """Disk caches opened once per process and shared by all sessions (diskcache is thread-safe)"""
+    return {
+        'crossref': diskcache.Cache("./.cache/crossref"),
+        'openalex': diskcache.Cache("./.cache/openalex"),
+        'citing': diskcache.Cache("./.cache/citing"),
+        'results': diskcache.Cache("./.cache/results")
+    }
+
 class AnalysisState:
     """Enhanced state management for analysis"""
     
     def __init__(self):
-        self.crossref_cache = {}
-        self.openalex_cache = {}
-        self.unified_cache = {}
-        self.citing_cache = defaultdict(list)
+        disk_caches = get_disk_caches()
+        # Persistent across sessions so reruns skip the APIs; hot entries are served from memory
+        self.crossref_cache = PersistentCache(disk_caches['crossref'])
+        self.openalex_cache = PersistentCache(disk_caches['openalex'], expire=OPENALEX_CACHE_TTL)
+        self.citing_cache = PersistentCache(disk_caches['citing'], expire=CITING_CACHE_TTL)
+        # In-memory cache is bounded and expires after an hour instead of growing for the whole session
+        self.unified_cache = MemoryTTLCache()
+        # Finished analyses keyed by request parameters, so repeated runs skip the whole pipeline.
+        # Shared across sessions on purpose: an entry depends only on the ISSN, period and flags and on
+        # public Crossref/OpenAlex data, so any user asking the same question gets the same report.
+        # Nothing session-specific is stored in it (the report file handle is rebuilt on restore).
+        self.results_cache = disk_caches['results']
         self.institution_cache = {}
-        self.journal_cache = {}
+        # Journal names by ISSN, read from disk once per session; get_journal_name writes new ones back
+        self.journal_cache = self.crossref_cache.get('journals') or {}
         self.analysis_results = None
         self.current_progress = 0
         self.progress_text = ""
@@ -1272,6 +1424,14 @@ st.set_page_config(
 EMAIL = st.secrets.get("EMAIL", "your.email@example.com") if hasattr(st, 'secrets') else "your.email@example.com"
 MAX_WORKERS = 5
 RETRIES = 3
+# Shared keep-alive client for all synchronous API calls (thread-safe); HTTP/2 multiplexes requests per host
+HTTP_CLIENT = httpx.Client(
+    http2=True,
+    follow_redirects=True,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+)
+# Failures the fetch helpers retry on: transport/HTTP errors and malformed or unexpected JSON
+FETCH_ERRORS = (httpx.HTTPError, ValueError, KeyError, IndexError, TypeError)
 DELAYS = [0.2, 0.5, 0.7, 1.0, 1.3, 1.5, 2.0]
 
 # --- State Storage Classes ---
@@ -1419,6 +1579,25 @@ class JournalAnalysisGlossary:
             'Technical': '⚫',
             'Databases': '🟤'
         }
+        
+        # Term names in definition order, built once for random picks and the term selector
+        self.term_names = tuple(self.terms)
+        
+        # Category -> terms and ready-made detailed info, so lookups on reruns do no scanning or formatting
+        terms_by_category = defaultdict(list)
+        self.detailed_info = {}
+        for term, info in self.terms.items():
+            terms_by_category[info['category']].append(term)
+            category_icon = self.category_colors.get(info['category'], '⚪')
+            self.detailed_info[term] = {
+                'term': term,
+                'definition': info['definition'],
+                'calculation': info.get('calculation', 'Not specified'),
+                'interpretation': info.get('interpretation', 'Not specified'),
+                'category': f"{category_icon} {info['category']}",
+                'example': info.get('example', 'Example not provided')
+            }
+        self.terms_by_category = {category: tuple(terms) for category, terms in terms_by_category.items()}
     
     def get_tooltip(self, term):
         """Generate text for tooltip"""
@@ -1437,30 +1616,15 @@ class JournalAnalysisGlossary:
     
     def get_detailed_info(self, term):
         """Complete term information for extended tooltips"""
-        if term not in self.terms:
-            return None
-        
-        info = self.terms[term]
-        category_icon = self.category_colors.get(info['category'], '⚪')
-        
-        detailed = {
-            'term': term,
-            'definition': info['definition'],
-            'calculation': info.get('calculation', 'Not specified'),
-            'interpretation': info.get('interpretation', 'Not specified'),
-            'category': f"{category_icon} {info['category']}",
-            'example': info.get('example', 'Example not provided')
-        }
-        
-        return detailed
+        return self.detailed_info.get(term)
     
     def get_terms_by_category(self, category):
         """Get all terms of category"""
-        return [term for term, info in self.terms.items() if info['category'] == category]
+        return list(self.terms_by_category.get(category, ()))
     
     def get_random_term(self):
         """Random term for learning"""
-        return random.choice(list(self.terms.keys()))
+        return random.choice(self.term_names)
 
 # Initialize global dictionary
 glossary = JournalAnalysisGlossary()
@@ -1485,21 +1649,38 @@ def get_analysis_state():
 class RateLimiter:
     def __init__(self, calls_per_second=5):
         self.calls_per_second = calls_per_second
-        self.timestamps = []
+        # Reserved call times, oldest first; expired entries are dropped from the left without rebuilding the list
+        self.timestamps = deque()
         self.lock = threading.Lock()
     
-    def wait_if_needed(self):
+    def drop_expired(self, now):
+        while self.timestamps and now - self.timestamps[0] >= 1.0:
+            self.timestamps.popleft()
+    
+    def reserve_slot(self):
+        """Reserve the next free call slot and return how long to wait for it.
+        Slots are handed out in time order, so the deque stays sorted and callers sleep outside the lock."""
         with self.lock:
             now = time.time()
-            self.timestamps = [ts for ts in self.timestamps if now - ts < 1.0]
+            self.drop_expired(now)
             
+            slot = now
             if len(self.timestamps) >= self.calls_per_second:
-                sleep_time = 1.0 - (now - self.timestamps[0])
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
-                self.timestamps = self.timestamps[1:]
+                slot = max(now, self.timestamps[-self.calls_per_second] + 1.0)
             
-            self.timestamps.append(now)
+            self.timestamps.append(slot)
+            return slot - now
+    
+    def wait_if_needed(self):
+        sleep_time = self.reserve_slot()
+        if sleep_time > 0:
+            time.sleep(sleep_time)
+    
+    async def async_wait_if_needed(self):
+        """Non-blocking variant for asyncio fetches"""
+        sleep_time = self.reserve_slot()
+        if sleep_time > 0:
+            await asyncio.sleep(sleep_time)
 
 rate_limiter = RateLimiter(calls_per_second=8)
 
@@ -1518,6 +1699,17 @@ class AdaptiveDelayer:
             delay = DELAYS[self.delay_index]
             time.sleep(delay)
             return delay
+    
+    async def async_wait(self, success=True):
+        """Non-blocking variant of wait() for asyncio fetches"""
+        with self.lock:
+            if success:
+                self.delay_index = 0
+            else:
+                self.delay_index = min(self.delay_index + 1, len(DELAYS) - 1)
+            delay = DELAYS[self.delay_index]
+        await asyncio.sleep(delay)
+        return delay
 
 delayer = AdaptiveDelayer()
 
@@ -1601,28 +1793,52 @@ def validate_and_clean_data(items):
         st.warning(translation_manager.get_text('articles_skipped').format(count=skipped_count))
     return validated
 
-# === 1. Journal Name ===
-def get_journal_name(issn):
-    state = get_analysis_state()
-    if issn in state.crossref_cache.get('journals', {}):
-        return state.crossref_cache['journals'][issn]
-    url = f"https://api.openalex.org/sources?filter=issn:{issn}"
+# === 0. Shared Request Helpers ===
+def retry_after_seconds(resp):
+    """Delay asked for by a 429/503 Retry-After header (capped at a minute), or None"""
+    if resp.status_code not in (429, 503):
+        return None
+    try:
+        return min(float(resp.headers.get('Retry-After', '')), 60.0)
+    except ValueError:
+        return None
+
+def fetch_json(url, headers=None, timeout=15):
+    """Blocking counterpart of async_fetch_json; returns None once the retries are used up"""
     for _ in range(RETRIES):
         try:
             rate_limiter.wait_if_needed()
-            resp = requests.get(url, timeout=10)
+            resp = HTTP_CLIENT.get(url, headers=headers, timeout=timeout)
             if resp.status_code == 200:
-                data = resp.json()
-                if data['meta']['count'] > 0:
-                    name = data['results'][0]['display_name']
-                    if 'journals' not in state.crossref_cache:
-                        state.crossref_cache['journals'] = {}
-                    state.crossref_cache['journals'][issn] = name
-                    delayer.wait(success=True)
-                    return name
-        except:
+                data = json_loads(resp.content)
+                delayer.wait(success=True)
+                return data
+            retry_after = retry_after_seconds(resp)
+            if retry_after:
+                # The server said when to come back; that replaces the adaptive delay
+                time.sleep(retry_after)
+                continue
+        except FETCH_ERRORS:
             pass
         delayer.wait(success=False)
+    return None
+
+# === 1. Journal Name ===
+def get_journal_name(issn):
+    state = get_analysis_state()
+    journals = state.journal_cache
+    if issn in journals:
+        return journals[issn]
+    data = fetch_json(f"https://api.openalex.org/sources?filter=issn:{issn}", timeout=10)
+    try:
+        if data and data['meta']['count'] > 0:
+            name = data['results'][0]['display_name']
+            # Persist the whole mapping: entries of the disk-backed cache are stored by value
+            journals[issn] = name
+            state.crossref_cache['journals'] = journals
+            return name
+    except FETCH_ERRORS:
+        pass
     return translation_manager.get_text('journal_not_found')
 
 # === 2. Crossref Metadata Retrieval ===
@@ -1631,49 +1847,32 @@ def get_crossref_metadata(doi, state):
         return state.crossref_cache[doi]
     if not doi or doi == 'N/A':
         return None
-    url = f"https://api.crossref.org/works/{quote(doi)}"
     headers = {'User-Agent': f"YourApp/1.0 (mailto:{EMAIL})"}
-    for _ in range(RETRIES):
-        try:
-            rate_limiter.wait_if_needed()
-            resp = requests.get(url, headers=headers, timeout=15)
-            if resp.status_code == 200:
-                data = resp.json()['message']
-                state.crossref_cache[doi] = data
-                delayer.wait(success=True)
-                return data
-        except:
-            pass
-        delayer.wait(success=False)
-    return None
+    data = fetch_json(f"https://api.crossref.org/works/{quote(doi)}", headers=headers, timeout=15)
+    data = data.get('message') if data else None
+    if data:
+        state.crossref_cache[doi] = data
+    return data
 
 # === 3. OpenAlex Metadata Retrieval ===
 def get_openalex_metadata(doi, state):
-    if doi in state.openalex_cache:
-        return state.openalex_cache[doi]
+    cached = state.openalex_cache.get(doi)
+    if cached is not None:
+        return cached
     if not doi or doi == 'N/A':
         return None
     normalized = doi if doi.startswith('http') else f"https://doi.org/{doi}"
-    url = f"https://api.openalex.org/works/{quote(normalized)}"
-    for _ in range(RETRIES):
-        try:
-            rate_limiter.wait_if_needed()
-            resp = requests.get(url, timeout=10)
-            if resp.status_code == 200:
-                data = resp.json()
-                state.openalex_cache[doi] = data
-                delayer.wait(success=True)
-                return data
-        except:
-            pass
-        delayer.wait(success=False)
-    return None
+    data = fetch_json(f"https://api.openalex.org/works/{quote(normalized)}", timeout=10)
+    if data:
+        state.openalex_cache[doi] = data
+    return data
 
 # === 4. Unified Metadata ===
 def get_unified_metadata(args):
     doi, state = args
-    if doi in state.unified_cache:
-        return state.unified_cache[doi]
+    cached = state.unified_cache.get(doi)
+    if cached is not None:
+        return cached
     
     if not doi or doi == 'N/A':
         return {'crossref': None, 'openalex': None}
@@ -1685,53 +1884,227 @@ def get_unified_metadata(args):
     state.unified_cache[doi] = result
     return result
 
+# === 4a. Async Metadata Retrieval ===
+async def async_fetch_json(session, url, headers=None, timeout=15):
+    """GET JSON with retries, sharing the global rate limiter and adaptive delays"""
+    for _ in range(RETRIES):
+        try:
+            await rate_limiter.async_wait_if_needed()
+            resp = await session.get(url, headers=headers, timeout=timeout)
+            if resp.status_code == 200:
+                data = json_loads(resp.content)
+                await delayer.async_wait(success=True)
+                return data
+            retry_after = retry_after_seconds(resp)
+            if retry_after:
+                await asyncio.sleep(retry_after)
+                continue
+        except FETCH_ERRORS:
+            pass
+        await delayer.async_wait(success=False)
+    return None
+
+async def async_get_crossref_metadata(session, doi, state):
+    if doi in state.crossref_cache:
+        return state.crossref_cache[doi]
+    headers = {'User-Agent': f"YourApp/1.0 (mailto:{EMAIL})"}
+    data = await async_fetch_json(session, f"https://api.crossref.org/works/{quote(doi)}", headers=headers, timeout=15)
+    data = data.get('message') if data else None
+    if data:
+        state.crossref_cache[doi] = data
+    return data
+
+async def async_get_openalex_metadata(session, doi, state):
+    cached = state.openalex_cache.get(doi)
+    if cached is not None:
+        return cached
+    normalized = doi if doi.startswith('http') else f"https://doi.org/{doi}"
+    data = await async_fetch_json(session, f"https://api.openalex.org/works/{quote(normalized)}", timeout=10)
+    if data:
+        state.openalex_cache[doi] = data
+    return data
+
+OPENALEX_BATCH_SIZE = 50  # OpenAlex caps OR-filters at 50 values
+
+def bare_doi(doi):
+    """Lowercase DOI without the resolver prefix, as used to match OpenAlex records"""
+    doi = doi.lower()
+    for prefix in ('https://doi.org/', 'http://doi.org/', 'doi:'):
+        if doi.startswith(prefix):
+            return doi[len(prefix):]
+    return doi
+
+async def prefetch_openalex_batch(session, dois, state):
+    """Fill state.openalex_cache with filter=doi:a|b|... requests, 50 DOIs per call.
+    DOIs OpenAlex does not return are left for the per-DOI lookup."""
+    missing = {}
+    for doi in dois:
+        if doi and doi != 'N/A' and state.openalex_cache.get(doi) is None:
+            missing.setdefault(bare_doi(doi), doi)
+    if not missing:
+        return
+    keys = list(missing)
+    
+    async def fetch_chunk(chunk):
+        url = (f"https://api.openalex.org/works?per-page={OPENALEX_BATCH_SIZE}"
+               f"&filter=doi:{'|'.join(quote(d) for d in chunk)}")
+        data = await async_fetch_json(session, url, timeout=30)
+        for w in (data or {}).get('results', []):
+            doi = missing.get(bare_doi(w.get('doi') or ''))
+            if doi:
+                state.openalex_cache[doi] = w
+    
+    await asyncio.gather(*(
+        fetch_chunk(keys[i:i + OPENALEX_BATCH_SIZE])
+        for i in range(0, len(keys), OPENALEX_BATCH_SIZE)
+    ))
+
+CROSSREF_BATCH_SIZE = 50
+
+async def prefetch_crossref_batch(session, dois, state):
+    """Fill state.crossref_cache with filter=doi:a,doi:b,... requests, 50 DOIs per call.
+    DOIs Crossref does not return are left for the per-DOI lookup."""
+    missing = {}
+    for doi in dois:
+        # A comma would split the filter value, so such DOIs go through the per-DOI lookup
+        if doi and doi != 'N/A' and ',' not in doi and doi not in state.crossref_cache:
+            missing.setdefault(bare_doi(doi), doi)
+    if not missing:
+        return
+    keys = list(missing)
+    headers = {'User-Agent': f"YourApp/1.0 (mailto:{EMAIL})"}
+    
+    async def fetch_chunk(chunk):
+        url = (f"https://api.crossref.org/works?rows={CROSSREF_BATCH_SIZE}"
+               f"&filter={','.join('doi:' + quote(d) for d in chunk)}")
+        data = await async_fetch_json(session, url, headers=headers, timeout=30)
+        for item in (data or {}).get('message', {}).get('items', []):
+            doi = missing.get(bare_doi(item.get('DOI') or ''))
+            if doi:
+                state.crossref_cache[doi] = item
+    
+    await asyncio.gather(*(
+        fetch_chunk(keys[i:i + CROSSREF_BATCH_SIZE])
+        for i in range(0, len(keys), CROSSREF_BATCH_SIZE)
+    ))
+
+def make_async_client():
+    # HTTP/2 multiplexes the concurrent requests to each API over a few connections
+    limits = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+    return httpx.AsyncClient(http2=True, follow_redirects=True, limits=limits)
+
+async def fetch_all_metadata(dois, state, on_progress=None, max_concurrency=64):
+    """Fetch Crossref and OpenAlex metadata for all DOIs on one event loop.
+    Returns (doi, result, error) tuples in completion order."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async with make_async_client() as session:
+        # One OpenAlex request per 50 DOIs; fetch_one then finds the records in the cache
+        await prefetch_openalex_batch(session, dois, state)
+        
+        async def fetch_one(doi):
+            async with semaphore:
+                try:
+                    if not doi or doi == 'N/A':
+                        return doi, {'crossref': None, 'openalex': None}, None
+                    crossref, openalex = await asyncio.gather(
+                        async_get_crossref_metadata(session, doi, state),
+                        async_get_openalex_metadata(session, doi, state)
+                    )
+                    return doi, {'crossref': crossref, 'openalex': openalex}, None
+                except Exception as e:
+                    return doi, None, e
+        
+        results = []
+        tasks = [fetch_one(doi) for doi in dois]
+        for i, task in enumerate(asyncio.as_completed(tasks)):
+            results.append(await task)
+            if on_progress:
+                on_progress(i + 1, len(tasks))
+        return results
+
 # === 5. Citing DOI Retrieval and Their Metadata ===
-def get_citing_dois_and_metadata(args):
-    analyzed_doi, state = args
+async def iter_citing_pages(session, work_id):
+    """Yield the work records of each OpenAlex cites: page, following the cursor.
+    Raises APIError when a page cannot be fetched, so partial lists are not mistaken for complete ones."""
+    url = f"https://api.openalex.org/works?filter=cites:{work_id}&per-page=100"
+    cursor = "*"
+    while cursor:
+        data = await async_fetch_json(session, f"{url}&cursor={cursor}", timeout=15)
+        if not data:
+            raise APIError(f"OpenAlex cites: page failed for {work_id}")
+        yield data.get('results', [])
+        cursor = data['meta'].get('next_cursor')
+
+async def async_get_citing_dois_and_metadata(session, analyzed_doi, state):
+    """Citing works of one analyzed DOI; Crossref records are bulk-fetched after pagination"""
     if analyzed_doi in state.citing_cache:
         return state.citing_cache[analyzed_doi]
     citing_list = []
-    oa_data = get_openalex_metadata(analyzed_doi, state)
-    if not oa_data or oa_data.get('cited_by_count', 0) == 0:
+    oa_data = await async_get_openalex_metadata(session, analyzed_doi, state)
+    if not oa_data:
+        # Lookup failed: nothing is cached so the next analysis tries again
+        return citing_list
+    if oa_data.get('cited_by_count', 0) == 0:
         state.citing_cache[analyzed_doi] = citing_list
         return citing_list
     work_id = oa_data['id'].split('/')[-1]
-    url = f"https://api.openalex.org/works?filter=cites:{work_id}&per-page=100"
-    cursor = "*"
     
-    while cursor:
-        success = False
-        for _ in range(RETRIES):
-            try:
-                rate_limiter.wait_if_needed()
-                resp = requests.get(f"{url}&cursor={cursor}", timeout=15)
-                if resp.status_code == 200:
-                    data = resp.json()
-                    for w in data.get('results', []):
-                        c_doi = w.get('doi')
-                        if c_doi:
-                            if c_doi not in state.crossref_cache:
-                                get_crossref_metadata(c_doi, state)
-                            if c_doi not in state.openalex_cache:
-                                get_openalex_metadata(c_doi, state)
-                            citing_list.append({
-                                'doi': c_doi,
-                                'pub_date': w.get('publication_date'),
-                                'crossref': state.crossref_cache.get(c_doi),
-                                'openalex': state.openalex_cache.get(c_doi)
-                            })
-                    cursor = data['meta'].get('next_cursor')
-                    delayer.wait(success=True)
-                    success = True
-                    break
-            except:
-                pass
-            delayer.wait(success=False)
-        if not success:
-            break
+    # Pages are chained by cursor, so they are walked first; Crossref enrichment then runs in bulk
+    works = []
+    page_error = None
+    try:
+        async for page in iter_citing_pages(session, work_id):
+            works.extend(w for w in page if w.get('doi'))
+    except APIError as e:
+        page_error = e
+    citing_dois = [w['doi'] for w in works]
+    await prefetch_crossref_batch(session, citing_dois, state)
+    await asyncio.gather(*(
+        async_get_crossref_metadata(session, c_doi, state)
+        for c_doi in set(citing_dois) if c_doi not in state.crossref_cache
+    ))
+    
+    for w in works:
+        c_doi = w['doi']
+        if c_doi not in state.openalex_cache:
+            # The cites: listing already returns full work records, no second request needed
+            state.openalex_cache[c_doi] = w
+        citing_list.append({
+            'doi': c_doi,
+            'pub_date': w.get('publication_date'),
+            'crossref': state.crossref_cache.get(c_doi),
+            'openalex': state.openalex_cache.get(c_doi)
+        })
+    # Only a complete list is cached; a partial one goes back to the caller with the error
+    if page_error:
+        raise IncompleteResultError(f"Incomplete citing list: {page_error}", citing_list)
     state.citing_cache[analyzed_doi] = citing_list
     return citing_list
 
+async def fetch_all_citing(dois, state, on_progress=None, max_concurrency=16):
+    """Collect citing works for all analyzed DOIs on one event loop.
+    Returns (doi, citings, error) tuples in completion order; an incomplete list comes with both."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async with make_async_client() as session:
+        async def fetch_one(doi):
+            async with semaphore:
+                try:
+                    return doi, await async_get_citing_dois_and_metadata(session, doi, state), None
+                except IncompleteResultError as e:
+                    return doi, e.partial, e
+                except Exception as e:
+                    return doi, None, e
+        
+        results = []
+        tasks = [fetch_one(doi) for doi in dois]
+        for i, task in enumerate(asyncio.as_completed(tasks)):
+            results.append(await task)
+            if on_progress:
+                on_progress(i + 1, len(tasks))
+        return results
+
 # === 6. Affiliation and Country Extraction ===
 def extract_affiliations_and_countries(openalex_data):
     affiliations = set()
@@ -1804,6 +2177,9 @@ def fetch_articles_by_issn_period(issn, from_date, until_date):
     cursor = "*"
     params = {
         'filter': f'issn:{issn},from-pub-date:{from_date},until-pub-date:{until_date}',
+        # Only DOI and creation date are read from the listing (full records are fetched per DOI later),
+        # so pages stay small on the wire and in memory
+        'select': 'DOI,created',
         'rows': 1000,
         'cursor': cursor,
         'mailto': EMAIL
@@ -1822,9 +2198,9 @@ def fetch_articles_by_issn_period(issn, from_date, until_date):
         for _ in range(RETRIES):
             try:
                 rate_limiter.wait_if_needed()
-                resp = requests.get(base_url, params=params, timeout=15)
+                resp = HTTP_CLIENT.get(base_url, params=params, timeout=15)
                 if resp.status_code == 200:
-                    data = resp.json()
+                    data = json_loads(resp.content)
                     new_items = data['message']['items']
                     items.extend(new_items)
                     cursor = data['message'].get('next-cursor')
@@ -1914,26 +2290,49 @@ def process_with_progress(items, func, desc="Processing", unit="items"):
     return results
 
 # === 11. Analysis of Overlaps Between Analyzed and Citing Works ===
-def analyze_overlaps(analyzed_metadata, citing_metadata, state):
+def collect_analyzed_citings(analyzed_metadata, state, citings_by_doi=None):
+    """(analyzed record, DOI, citing works) for every analyzed work with a Crossref DOI.
+    Built once and shared by the citation analytics instead of each repeating the lookups.
+    citings_by_doi holds the lists already collected in this run; the rest come from the citing
+    cache, and any still missing are fetched together on one event loop."""
+    citings_by_doi = dict(citings_by_doi or {})
+    analyzed_dois = []
+    for analyzed in analyzed_metadata:
+        if analyzed and analyzed.get('crossref'):
+            analyzed_doi = analyzed['crossref'].get('DOI')
+            if analyzed_doi:
+                analyzed_dois.append((analyzed, analyzed_doi))
+    
+    missing = []
+    for _, analyzed_doi in analyzed_dois:
+        if analyzed_doi not in citings_by_doi:
+            if analyzed_doi in state.citing_cache:
+                citings_by_doi[analyzed_doi] = state.citing_cache[analyzed_doi]
+            else:
+                missing.append(analyzed_doi)
+    if missing:
+        # Callers run in the script thread or worker threads, neither of which has a running event loop
+        for doi, citings, error in asyncio.run(fetch_all_citing(list(dict.fromkeys(missing)), state)):
+            citings_by_doi[doi] = citings or []
+    
+    return [(analyzed, analyzed_doi, citings_by_doi[analyzed_doi]) for analyzed, analyzed_doi in analyzed_dois]
+
+def analyze_overlaps(analyzed_metadata, citing_metadata, state, analyzed_citings=None):
     """Analysis of overlaps between analyzed and citing works"""
+    if analyzed_citings is None:
+        analyzed_citings = collect_analyzed_citings(analyzed_metadata, state)
     
     overlap_details = []
+    # A citing work usually cites several analyzed works, so its author/affiliation sets are built once
+    citing_sets = {}
     
-    for analyzed in analyzed_metadata:
-        if not analyzed or not analyzed.get('crossref'):
-            continue
-            
-        analyzed_doi = analyzed['crossref'].get('DOI')
-        if not analyzed_doi:
-            continue
-            
+    for analyzed, analyzed_doi, citings in analyzed_citings:
         # Get authors and affiliations of analyzed work
         analyzed_authors, analyzed_affiliations, _ = extract_affiliations_and_countries(analyzed.get('openalex'))
-        analyzed_authors_set = set(analyzed_authors)
-        analyzed_affiliations_set = set(analyzed_affiliations)
-        
-        # Get citing works
-        citings = get_citing_dois_and_metadata((analyzed_doi, state))
+        analyzed_authors_set = frozenset(analyzed_authors)
+        analyzed_affiliations_set = frozenset(analyzed_affiliations)
+        if not analyzed_authors_set and not analyzed_affiliations_set:
+            continue
         
         for citing in citings:
             if not citing or not citing.get('openalex'):
@@ -1944,13 +2343,19 @@ def analyze_overlaps(analyzed_metadata, citing_metadata, state):
                 continue
             
             # Get authors and affiliations of citing work
-            citing_authors, citing_affiliations, _ = extract_affiliations_and_countries(citing.get('openalex'))
-            citing_authors_set = set(citing_authors)
-            citing_affiliations_set = set(citing_affiliations)
+            sets = citing_sets.get(citing_doi)
+            if sets is None:
+                citing_authors, citing_affiliations, _ = extract_affiliations_and_countries(citing.get('openalex'))
+                sets = citing_sets[citing_doi] = (frozenset(citing_authors), frozenset(citing_affiliations))
+            citing_authors_set, citing_affiliations_set = sets
+            
+            # Most pairs share nothing; isdisjoint stops at the first common element and builds no set
+            if analyzed_authors_set.isdisjoint(citing_authors_set) and analyzed_affiliations_set.isdisjoint(citing_affiliations_set):
+                continue
             
             # Find overlaps
-            common_authors = analyzed_authors_set.intersection(citing_authors_set)
-            common_affiliations = analyzed_affiliations_set.intersection(citing_affiliations_set)
+            common_authors = analyzed_authors_set & citing_authors_set
+            common_affiliations = analyzed_affiliations_set & citing_affiliations_set
             
             if common_authors or common_affiliations:
                 overlap_details.append({
@@ -1965,87 +2370,104 @@ def analyze_overlaps(analyzed_metadata, citing_metadata, state):
     return overlap_details
 
 # === 12. Citation Accumulation Speed Analysis ===
-def analyze_citation_accumulation(analyzed_metadata, state):
-    accumulation_data = defaultdict(lambda: defaultdict(int))
-    yearly_citations = defaultdict(int)
+def analyze_citation_accumulation(analyzed_metadata, state, analyzed_citings=None):
+    if analyzed_citings is None:
+        analyzed_citings = collect_analyzed_citings(analyzed_metadata, state)
+    # One (publication year, citing year) pair per citation; year differences are taken on arrays
+    pub_years = []
+    cite_years = []
+    
+    for analyzed, analyzed_doi, citings in analyzed_citings:
+        pub_year = get_publication_year(analyzed['crossref'])
+        if not pub_year:
+            continue
+        
+        for citing in citings:
+            if citing.get('openalex'):
+                pub_years.append(pub_year)
+                cite_years.append(citing['openalex'].get('publication_year') or 0)
     
-    for analyzed in analyzed_metadata:
-        if analyzed and analyzed.get('crossref'):
-            analyzed_doi = analyzed['crossref'].get('DOI')
-            if not analyzed_doi:
-                continue
-                
-            pub_year = analyzed['crossref'].get('published', {}).get('date-parts', [[0]])[0][0]
-            if not pub_year:
-                continue
-            
-            citings = get_citing_dois_and_metadata((analyzed_doi, state))
-            
-            for citing in citings:
-                if citing.get('openalex'):
-                    cite_year = citing['openalex'].get('publication_year', 0)
-                    if cite_year >= pub_year:
-                        yearly_citations[cite_year] += 1
-                        years_since_pub = cite_year - pub_year
-                        if years_since_pub >= 0:
-                            for year in range(years_since_pub + 1):
-                                accumulation_data[pub_year][year] += 1
+    pub_years = np.array(pub_years, dtype=np.int32)
+    cite_years = np.array(cite_years, dtype=np.int32)
+    years_since = cite_years - pub_years
+    valid = years_since >= 0
+    pub_years, cite_years, years_since = pub_years[valid], cite_years[valid], years_since[valid]
+    
+    # Citations per citing year
+    years, year_counts = np.unique(cite_years, return_counts=True)
+    yearly_array = np.column_stack((years, year_counts)).astype(np.int32)
+    
+    # Group offsets by publication year with one stable sort instead of a mask per year
+    order = np.argsort(pub_years, kind='stable')
+    groups, starts = np.unique(pub_years[order], return_index=True)
     
     accumulation_curves = {}
-    for pub_year, yearly_counts in accumulation_data.items():
-        sorted_years = sorted(yearly_counts.keys())
-        cumulative_counts = []
-        current_total = 0
-        for year in sorted_years:
-            current_total += yearly_counts[year]
-            cumulative_counts.append({
-                'years_since_publication': year,
-                'cumulative_citations': current_total
-            })
-        accumulation_curves[pub_year] = cumulative_counts
+    for pub_year, since in zip(groups.tolist(), np.split(years_since[order], starts[1:])):
+        # Citations reaching at least each offset (suffix sums), then accumulated over offsets
+        reached = np.cumsum(np.bincount(since)[::-1])[::-1]
+        accumulation_curves[pub_year] = [
+            {'years_since_publication': year, 'cumulative_citations': total}
+            for year, total in enumerate(np.cumsum(reached).tolist())
+        ]
     
-    yearly_stats = []
-    for year in sorted(yearly_citations.keys()):
-        yearly_stats.append({
-            'year': year,
-            'citations_count': yearly_citations[year]
-        })
+    yearly_stats = [
+        {'year': year, 'citations_count': count}
+        for year, count in yearly_array.tolist()
+    ]
     
     return {
-        'accumulation_curves': dict(accumulation_curves),
+        'accumulation_curves': accumulation_curves,
         'yearly_citations': yearly_stats,
-        'total_years_covered': len(yearly_citations)
+        'yearly_array': yearly_array,
+        'total_years_covered': len(years)
     }
 
 # === 13. Metadata Processing for Statistics ===
+def crossref_author_name(auth):
+    """'Family I.N.' label of a Crossref author, as counted in the author statistics"""
+    return format_author_name(auth.get('family', ''), auth.get('given', ''))
+
+@lru_cache(maxsize=100000)
+def format_author_name(family, given):
+    # Authors recur across articles, so each raw (family, given) pair is formatted once
+    family = family.strip().title()
+    given = given.strip()
+    initials = '.'.join([c + '.' for c in given if c.isupper()]) if given else ''
+    if initials:
+        return f"{family} {initials}"
+    return family or 'Unknown'
+
+@lru_cache(maxsize=4096)
+def publication_datetime(year, month, day):
+    """datetime for a publication date; articles share a small set of dates, so they are built once"""
+    return datetime(year, month, day)
+
 def extract_stats_from_metadata(metadata_list, is_analyzed=True, journal_prefix=''):
     total_refs = 0
     refs_with_doi = 0
     refs_without_doi = 0
     self_cites = 0
+    # Per-article numbers are collected into lists and reduced with NumPy after the loop
     ref_counts = []
     author_counts = []
-    single_authors = 0
-    multi_authors_gt10 = 0
+    citation_counts = []
+    country_counts = []
     author_freq = Counter()
     pub_dates = []
-    
-    articles_with_10_citations = 0
-    articles_with_20_citations = 0
-    articles_with_30_citations = 0
-    articles_with_50_citations = 0
 
     affiliations_freq = Counter()
     countries_freq = Counter()
-    single_country_articles = 0
-    multi_country_articles = 0
-    no_country_articles = 0
-    all_authors = []
-    all_affiliations = []
-    all_countries = []
     
     journal_freq = Counter()
     publisher_freq = Counter()
+    
+    # Read once instead of calling datetime.now() for every article without a date
+    default_date_parts = [[datetime.now().year]]
+    
+    # Crossref reference DOIs are almost always bare "10.xxxx/..." strings, so a startswith check
+    # settles self-citations without normalizing; other forms still go through get_doi_prefix
+    numeric_prefix = journal_prefix.startswith('10.') and journal_prefix[3:].replace('.', '').isdigit()
+    prefix_slash = journal_prefix + '/' if numeric_prefix else None
 
     for meta in metadata_list:
         if not meta:
@@ -2080,7 +2502,10 @@ def extract_stats_from_metadata(metadata_list, is_analyzed=True, journal_prefix=
                     ref_doi = ref.get('DOI', '')
                     if ref_doi:
                         refs_with_doi += 1
-                        if get_doi_prefix(ref_doi) == journal_prefix:
+                        if prefix_slash is None or not ref_doi.startswith('10.') or '/' not in ref_doi:
+                            if get_doi_prefix(ref_doi) == journal_prefix:
+                                self_cites += 1
+                        elif ref_doi.startswith(prefix_slash):
                             self_cites += 1
                     else:
                         refs_without_doi += 1
@@ -2089,25 +2514,12 @@ def extract_stats_from_metadata(metadata_list, is_analyzed=True, journal_prefix=
             ref_counts.append(ref_count)
 
             authors = cr.get('author', [])
-            num_auth = len(authors)
-            author_counts.append(num_auth)
-            if num_auth == 1:
-                single_authors += 1
-            if num_auth > 10:
-                multi_authors_gt10 += 1
-
-            for auth in authors:
-                family = auth.get('family', '').strip().title()
-                given = auth.get('given', '').strip()
-                initials = '.'.join([c + '.' for c in given if c.isupper()]) if given else ''
-                if initials:
-                    name = f"{family} {initials}"
-                else:
-                    name = family or 'Unknown'
-                author_freq[name] += 1
+            author_counts.append(len(authors))
+
+            author_freq.update(map(crossref_author_name, authors))
 
-            date_parts = cr.get('published', {}).get('date-parts', [[datetime.now().year]])[0]
-            pub_date = datetime(date_parts[0], date_parts[1] if len(date_parts)>1 else 1, date_parts[2] if len(date_parts)>2 else 1)
+            date_parts = cr.get('published', {}).get('date-parts', default_date_parts)[0]
+            pub_date = publication_datetime(date_parts[0], date_parts[1] if len(date_parts)>1 else 1, date_parts[2] if len(date_parts)>2 else 1)
             pub_dates.append(pub_date)
             
             journal_name = cr.get('container-title', [''])[0] if cr.get('container-title') else ''
@@ -2120,24 +2532,12 @@ def extract_stats_from_metadata(metadata_list, is_analyzed=True, journal_prefix=
         oa = meta.get('openalex')
         if oa:
             try:
-                authors_list, affiliations_list, countries_list = extract_affiliations_and_countries(oa)
+                _, affiliations_list, countries_list = extract_affiliations_and_countries(oa)
                 
-                all_authors.extend(authors_list)
-                all_affiliations.extend(affiliations_list)
-                all_countries.extend(countries_list)
+                affiliations_freq.update(affiliations_list)
+                countries_freq.update(countries_list)
                 
-                for aff in affiliations_list:
-                    affiliations_freq[aff] += 1
-                for country in countries_list:
-                    countries_freq[country] += 1
-                
-                unique_countries = set(countries_list)
-                if len(unique_countries) == 0:
-                    no_country_articles += 1
-                elif len(unique_countries) == 1:
-                    single_country_articles += 1
-                elif len(unique_countries) > 1:
-                    multi_country_articles += 1
+                country_counts.append(len(set(countries_list)))
                 
                 host_venue = oa.get('host_venue', {})
                 if host_venue:
@@ -2149,15 +2549,7 @@ def extract_stats_from_metadata(metadata_list, is_analyzed=True, journal_prefix=
                         publisher_freq[publisher] += 1
                 
                 if is_analyzed:
-                    citation_count = oa.get('cited_by_count', 0)
-                    if citation_count >= 10:
-                        articles_with_10_citations += 1
-                    if citation_count >= 20:
-                        articles_with_20_citations += 1
-                    if citation_count >= 30:
-                        articles_with_30_citations += 1
-                    if citation_count >= 50:
-                        articles_with_50_citations += 1
+                    citation_counts.append(oa.get('cited_by_count', 0))
             except Exception as e:
                 # Skip problematic records and continue processing
                 print(f"Warning processing OpenAlex data: {e}")
@@ -2169,15 +2561,41 @@ def extract_stats_from_metadata(metadata_list, is_analyzed=True, journal_prefix=
     refs_without_doi_pct = (refs_without_doi / total_refs * 100) if total_refs > 0 else 0
     self_cites_pct = (self_cites / total_refs * 100) if total_refs > 0 else 0
 
-    ref_min = min(ref_counts) if ref_counts else 0
-    ref_max = max(ref_counts) if ref_counts else 0
-    ref_mean = sum(ref_counts)/n_items if n_items > 0 else 0
-    ref_median = sorted(ref_counts)[n_items//2] if n_items > 0 else 0
+    ref_counts_arr = np.asarray(ref_counts, dtype=np.int64)
+    author_counts_arr = np.asarray(author_counts, dtype=np.int64)
+    citation_counts_arr = np.asarray(citation_counts, dtype=np.int64)
+    country_counts_arr = np.asarray(country_counts, dtype=np.int64)
 
-    auth_min = min(author_counts) if author_counts else 0
-    auth_max = max(author_counts) if author_counts else 0
-    auth_mean = sum(author_counts)/n_items if n_items > 0 else 0
-    auth_median = sorted(author_counts)[n_items//2] if n_items > 0 else 0
+    def upper_median(values):
+        """Element at position n_items // 2 of the sorted values (clamped to the last one)"""
+        if n_items == 0 or values.size == 0:
+            return 0
+        k = min(n_items // 2, values.size - 1)
+        return int(np.partition(values, k)[k])
+
+    ref_min = int(ref_counts_arr.min()) if ref_counts_arr.size else 0
+    ref_max = int(ref_counts_arr.max()) if ref_counts_arr.size else 0
+    ref_mean = int(ref_counts_arr.sum()) / n_items if n_items > 0 else 0
+    ref_median = upper_median(ref_counts_arr)
+
+    auth_min = int(author_counts_arr.min()) if author_counts_arr.size else 0
+    auth_max = int(author_counts_arr.max()) if author_counts_arr.size else 0
+    auth_mean = int(author_counts_arr.sum()) / n_items if n_items > 0 else 0
+    auth_median = upper_median(author_counts_arr)
+
+    single_authors = int((author_counts_arr == 1).sum())
+    multi_authors_gt10 = int((author_counts_arr > 10).sum())
+
+    # One histogram (counts above 50 share the last bin) gives every threshold as a tail sum
+    citations_at_least = np.bincount(np.clip(citation_counts_arr, 0, 50), minlength=51)[::-1].cumsum()[::-1]
+    articles_with_10_citations = int(citations_at_least[10])
+    articles_with_20_citations = int(citations_at_least[20])
+    articles_with_30_citations = int(citations_at_least[30])
+    articles_with_50_citations = int(citations_at_least[50])
+
+    no_country_articles = int((country_counts_arr == 0).sum())
+    single_country_articles = int((country_counts_arr == 1).sum())
+    multi_country_articles = int((country_counts_arr > 1).sum())
 
     all_authors_sorted = author_freq.most_common()
 
@@ -2209,18 +2627,15 @@ def extract_stats_from_metadata(metadata_list, is_analyzed=True, journal_prefix=
         'articles_with_50_citations': articles_with_50_citations,
         'all_affiliations': all_affiliations_sorted,
         'all_countries': all_countries_sorted,
-        'all_authors_list': all_authors,
-        'all_affiliations_list': all_affiliations,
-        'all_countries_list': all_countries,
         'single_country_articles': single_country_articles, 
         'single_country_pct': single_country_pct,
         'multi_country_articles': multi_country_articles, 
         'multi_country_pct': multi_country_pct,
         'no_country_articles': no_country_articles,
         'no_country_pct': no_country_pct,
-        'total_affiliations_count': len(all_affiliations),
-        'unique_affiliations_count': len(set(all_affiliations)),
-        'unique_countries_count': len(set(all_countries)),
+        'total_affiliations_count': sum(affiliations_freq.values()),
+        'unique_affiliations_count': len(affiliations_freq),
+        'unique_countries_count': len(countries_freq),
         'all_journals': all_journals_sorted,
         'all_publishers': all_publishers_sorted,
         'unique_journals_count': len(journal_freq),
@@ -2228,161 +2643,139 @@ def extract_stats_from_metadata(metadata_list, is_analyzed=True, journal_prefix=
     }
 
 # === 14. Enhanced Statistics Calculation ===
-def enhanced_stats_calculation(analyzed_metadata, citing_metadata, state):
+def enhanced_stats_calculation(analyzed_metadata, citing_metadata, state, analyzed_citings=None):
+    if analyzed_citings is None:
+        analyzed_citings = collect_analyzed_citings(analyzed_metadata, state)
     citation_network = defaultdict(list)
     citation_counts = []
     
-    for analyzed in analyzed_metadata:
-        if analyzed and analyzed.get('crossref'):
-            analyzed_doi = analyzed['crossref'].get('DOI')
-            if analyzed_doi:
-                analyzed_year = analyzed['crossref'].get('published', {}).get('date-parts', [[0]])[0][0]
-                citings = get_citing_dois_and_metadata((analyzed_doi, state))
-                citation_counts.append(len(citings))
-                
-                for citing in citings:
-                    if citing.get('openalex'):
-                        citing_year = citing['openalex'].get('publication_year', 0)
-                        citation_network[analyzed_year].append(citing_year)
-    
-    citation_counts.sort(reverse=True)
-    h_index = 0
-    for i, count in enumerate(citation_counts):
-        if count >= i + 1:
-            h_index = i + 1
-        else:
-            break
+    for analyzed, analyzed_doi, citings in analyzed_citings:
+        analyzed_year = get_publication_year(analyzed['crossref']) or 0
+        citation_counts.append(len(citings))
+        
+        for citing in citings:
+            if citing.get('openalex'):
+                citing_year = citing['openalex'].get('publication_year', 0)
+                citation_network[analyzed_year].append(citing_year)
+    
+    # Summary figures come from one NumPy column instead of repeated passes over the list
+    counts = np.asarray(citation_counts, dtype=np.int64)
+    n = counts.size
+    # O(n) h-index: at_least[k] is the number of articles with >= k citations (k <= n),
+    # and h is the largest k with at_least[k] >= k
+    at_least = np.bincount(np.minimum(counts, n), minlength=n + 1)[::-1].cumsum()[::-1]
+    h_index = int(np.flatnonzero(at_least >= np.arange(n + 1))[-1])
+    total_citations = int(counts.sum())
     
     return {
         'h_index': h_index,
         'citation_network': dict(citation_network),
-        'avg_citations_per_article': sum(citation_counts) / len(citation_counts) if citation_counts else 0,
-        'max_citations': max(citation_counts) if citation_counts else 0,
-        'min_citations': min(citation_counts) if citation_counts else 0,
-        'total_citations': sum(citation_counts),
-        'articles_with_citations': len([c for c in citation_counts if c > 0]),
-        'articles_without_citations': len([c for c in citation_counts if c == 0])
+        'avg_citations_per_article': total_citations / n if n else 0,
+        'max_citations': int(counts.max()) if n else 0,
+        'min_citations': int(counts.min()) if n else 0,
+        'total_citations': total_citations,
+        'articles_with_citations': int((counts > 0).sum()),
+        'articles_without_citations': int((counts == 0).sum())
     }
 
 # === 15. Time to First Citation Calculation ===
-def calculate_citation_timing_stats(analyzed_metadata, state):
-    """Calculate time to first citation statistics with proper DOI prefix comparison"""
+def iter_parsed_citation_dates(citing_dates):
+    """Lazily yield (day ordinal, citing_doi) pairs, skipping unparseable dates"""
+    for pub_date, citing_doi in citing_dates:
+        try:
+            yield date.fromisoformat(pub_date[:10]).toordinal(), citing_doi
+        except:
+            continue
+
+def process_citation_timing(timing_inputs):
+    """Time to first citation for (analyzed_doi, date_parts, [(pub_date, citing_doi), ...]) entries"""
+    days_list = []
+    details_list = []
     
-    def normalize_doi(doi):
-        """Normalize DOI to consistent format (without https://doi.org/)"""
-        if not doi or doi == 'N/A':
-            return ""
-        
-        # Convert to string and clean
-        doi_str = str(doi).strip().lower()
+    for analyzed_doi, analyzed_date_parts, citing_dates in timing_inputs:
+        analyzed_year = analyzed_date_parts[0]
+        analyzed_month = analyzed_date_parts[1] if len(analyzed_date_parts) > 1 else 1
+        analyzed_day = analyzed_date_parts[2] if len(analyzed_date_parts) > 2 else 1
         
-        # Remove various DOI prefixes
-        prefixes = [
-            'https://doi.org/',
-            'http://doi.org/',
-            'doi.org/',
-            'doi:'
-        ]
-        
-        for prefix in prefixes:
-            if doi_str.startswith(prefix):
-                doi_str = doi_str[len(prefix):]
-                break
+        try:
+            analyzed_ordinal = date(analyzed_year, analyzed_month, analyzed_day).toordinal()
+        except:
+            continue
         
-        return doi_str
-    
-    def get_doi_prefix_from_normalized(doi):
-        """Extract DOI prefix from normalized DOI"""
-        if not doi:
-            return ''
+        first_citation = min(iter_parsed_citation_dates(citing_dates), key=lambda x: x[0], default=None)
         
-        # Extract part before first /
-        if '/' in doi:
-            return doi.split('/')[0]
-        return doi
-    
-    all_days_to_first_citation = []
-    citation_timing_stats = {}
-    first_citation_details = []
-    
-    for analyzed in analyzed_metadata:
-        if analyzed and analyzed.get('crossref'):
-            analyzed_doi = analyzed['crossref'].get('DOI')
-            if not analyzed_doi:
-                continue
-                
-            analyzed_date_parts = analyzed['crossref'].get('published', {}).get('date-parts', [[]])[0]
-            if not analyzed_date_parts or len(analyzed_date_parts) < 1:
-                continue
-                
-            analyzed_year = analyzed_date_parts[0]
-            analyzed_month = analyzed_date_parts[1] if len(analyzed_date_parts) > 1 else 1
-            analyzed_day = analyzed_date_parts[2] if len(analyzed_date_parts) > 2 else 1
+        if first_citation:
+            first_citation_ordinal, first_citing_doi = first_citation
+            days_to_first_citation = first_citation_ordinal - analyzed_ordinal
             
-            try:
-                analyzed_date = datetime(analyzed_year, analyzed_month, analyzed_day)
-            except:
-                continue
+            # === FIXED DOI PREFIX COMPARISON ===
+            # Normalize DOIs before comparison
+            analyzed_doi_normalized = normalize_doi(analyzed_doi)
+            citing_doi_normalized = normalize_doi(first_citing_doi)
             
-            citings = get_citing_dois_and_metadata((analyzed_doi, state))
-            citation_dates = []
+            # Extract prefixes from normalized DOIs
+            analyzed_prefix = get_doi_prefix(analyzed_doi_normalized)
+            citing_prefix = get_doi_prefix(citing_doi_normalized)
             
-            for citing in citings:
-                if citing.get('pub_date'):
-                    try:
-                        cite_date = datetime.fromisoformat(citing['pub_date'].replace('Z', '+00:00'))
-                        citation_dates.append((cite_date, citing.get('doi')))
-                    except:
-                        continue
+            # Check if prefixes match (excluding empty prefixes)
+            same_prefix = (analyzed_prefix == citing_prefix and analyzed_prefix != '')
+            same_date = (days_to_first_citation == 0)
+            is_editorial_note = same_prefix and same_date
             
-            if citation_dates:
-                first_citation_date, first_citing_doi = min(citation_dates, key=lambda x: x[0])
-                days_to_first_citation = (first_citation_date - analyzed_date).days
-                
-                # === FIXED DOI PREFIX COMPARISON ===
-                # Normalize DOIs before comparison
-                analyzed_doi_normalized = normalize_doi(analyzed_doi)
-                citing_doi_normalized = normalize_doi(first_citing_doi)
-                
-                # Extract prefixes from normalized DOIs
-                analyzed_prefix = get_doi_prefix_from_normalized(analyzed_doi_normalized)
-                citing_prefix = get_doi_prefix_from_normalized(citing_doi_normalized)
-                
-                # Check if prefixes match (excluding empty prefixes)
-                same_prefix = (analyzed_prefix == citing_prefix and analyzed_prefix != '')
-                same_date = (analyzed_date.date() == first_citation_date.date())
-                is_editorial_note = same_prefix and same_date
+            if days_to_first_citation >= 0:
+                # Always save all details for Excel reporting
+                details_list.append({
+                    'analyzed_doi': analyzed_doi,
+                    'analyzed_doi_normalized': analyzed_doi_normalized,
+                    'citing_doi': first_citing_doi,
+                    'citing_doi_normalized': citing_doi_normalized,
+                    'analyzed_date': date.fromordinal(analyzed_ordinal),
+                    'first_citation_date': date.fromordinal(first_citation_ordinal),
+                    'days_to_first_citation': days_to_first_citation,
+                    'same_prefix': same_prefix,
+                    'same_date': same_date,
+                    'is_editorial_note': is_editorial_note,
+                    'analyzed_prefix': analyzed_prefix,
+                    'citing_prefix': citing_prefix
+                })
                 
-                if days_to_first_citation >= 0:
-                    # Always save all details for Excel reporting
-                    first_citation_details.append({
-                        'analyzed_doi': analyzed_doi,
-                        'analyzed_doi_normalized': analyzed_doi_normalized,
-                        'citing_doi': first_citing_doi,
-                        'citing_doi_normalized': citing_doi_normalized,
-                        'analyzed_date': analyzed_date,
-                        'first_citation_date': first_citation_date,
-                        'days_to_first_citation': days_to_first_citation,
-                        'same_prefix': same_prefix,
-                        'same_date': same_date,
-                        'is_editorial_note': is_editorial_note,
-                        'analyzed_prefix': analyzed_prefix,
-                        'citing_prefix': citing_prefix
-                    })
-                    
-                    # Exclude editorial notes from statistical calculations
-                    if not is_editorial_note:
-                        all_days_to_first_citation.append(days_to_first_citation)
-                    else:
-                        print(f"⚠️ Editorial note excluded: {analyzed_doi} -> {first_citing_doi} (same prefix: {analyzed_prefix}, same date: {same_date})")
+                # Exclude editorial notes from statistical calculations
+                if not is_editorial_note:
+                    days_list.append(days_to_first_citation)
+                else:
+                    print(f"⚠️ Editorial note excluded: {analyzed_doi} -> {first_citing_doi} (same prefix: {analyzed_prefix}, same date: {same_date})")
+    
+    return days_list, details_list
+
+def calculate_citation_timing_stats(analyzed_metadata, state, analyzed_citings=None):
+    """Calculate time to first citation statistics with proper DOI prefix comparison"""
+    if analyzed_citings is None:
+        analyzed_citings = collect_analyzed_citings(analyzed_metadata, state)
+    
+    citation_timing_stats = {}
+    
+    # Only the publication dates and DOIs are needed for the timing
+    timing_inputs = []
+    for analyzed, analyzed_doi, citings in analyzed_citings:
+        analyzed_date_parts = analyzed['crossref'].get('published', {}).get('date-parts', [[]])[0]
+        if not analyzed_date_parts or len(analyzed_date_parts) < 1:
+            continue
+        
+        citing_dates = [(citing['pub_date'], citing.get('doi')) for citing in citings if citing.get('pub_date')]
+        timing_inputs.append((analyzed_doi, analyzed_date_parts, citing_dates))
+    
+    # Parsing a few dates per article is cheaper than shipping the inputs to worker processes
+    all_days_to_first_citation, first_citation_details = process_citation_timing(timing_inputs)
     
     if all_days_to_first_citation:
+        # One array conversion shared by all reductions
+        days = np.asarray(all_days_to_first_citation, dtype=np.int64)
         citation_timing_stats = {
             # Statistics WITHOUT editorial notes (for Citing_Stats)
-            'min_days_to_first_citation': min(all_days_to_first_citation),
-            'max_days_to_first_citation': max(all_days_to_first_citation),
-            'mean_days_to_first_citation': np.mean(all_days_to_first_citation),
-            'median_days_to_first_citation': np.median(all_days_to_first_citation),
+            'min_days_to_first_citation': int(days.min()),
+            'max_days_to_first_citation': int(days.max()),
+            'mean_days_to_first_citation': days.mean(),
+            'median_days_to_first_citation': np.median(days),
             'articles_with_citation_timing_data': len(all_days_to_first_citation),
             
             # All details (for Excel)
@@ -2415,9 +2808,11 @@ def calculate_citation_timing_stats(analyzed_metadata, state):
     return citation_timing_stats
 
 # === 16. Citation Timing Calculation ===
-def calculate_citation_timing(analyzed_metadata, state):
-    timing_stats = calculate_citation_timing_stats(analyzed_metadata, state)
-    accumulation_stats = analyze_citation_accumulation(analyzed_metadata, state)
+def calculate_citation_timing(analyzed_metadata, state, analyzed_citings=None):
+    if analyzed_citings is None:
+        analyzed_citings = collect_analyzed_citings(analyzed_metadata, state)
+    timing_stats = calculate_citation_timing_stats(analyzed_metadata, state, analyzed_citings)
+    accumulation_stats = analyze_citation_accumulation(analyzed_metadata, state, analyzed_citings)
     
     return {
         'days_min': timing_stats['min_days_to_first_citation'],
@@ -2428,14 +2823,41 @@ def calculate_citation_timing(analyzed_metadata, state):
         'first_citation_details': timing_stats['first_citation_details'],
         'accumulation_curves': accumulation_stats['accumulation_curves'],
         'yearly_citations': accumulation_stats['yearly_citations'],
+        'yearly_array': accumulation_stats['yearly_array'],
         'total_years_covered': accumulation_stats['total_years_covered']
     }
 
 # === NEW FUNCTIONS: FAST METRICS WITHOUT API REQUESTS ===
 
+@njit(cache=True)
+def reference_ages_kernel(ref_years, current_year):
+    """Sum and 25/50/75th percentiles of reference ages, read off a histogram of ages instead of a sort.
+    Percentiles use the same linear interpolation as np.percentile."""
+    n = ref_years.shape[0]
+    max_year = ref_years.max()
+    min_age = current_year - max_year
+    hist = np.zeros(max_year - ref_years.min() + 1, np.int64)
+    total = 0
+    for y in ref_years:
+        age = current_year - y
+        hist[age - min_age] += 1
+        total += age
+    cumulative = np.cumsum(hist)
+    
+    levels = np.array([0.25, 0.5, 0.75])
+    quantiles = np.empty(3)
+    for j in range(3):
+        pos = levels[j] * (n - 1)
+        k = int(pos)
+        # k-th smallest age: first bin whose cumulative count exceeds k
+        lo = np.searchsorted(cumulative, k, side='right') + min_age
+        hi = np.searchsorted(cumulative, min(k + 1, n - 1), side='right') + min_age
+        quantiles[j] = lo + (hi - lo) * (pos - k)
+    return total, quantiles
+
 def calculate_reference_age_fast(analyzed_metadata, state):
     """Reference age calculation without additional API requests"""
-    ref_ages = []
+    ref_years = []
     current_year = datetime.now().year
     
     for meta in analyzed_metadata:
@@ -2443,7 +2865,7 @@ def calculate_reference_age_fast(analyzed_metadata, state):
         if not cr: 
             continue
         
-        pub_year = cr.get('published', {}).get('date-parts', [[0]])[0][0]
+        pub_year = get_publication_year(cr)
         if not pub_year: 
             continue
         
@@ -2453,21 +2875,21 @@ def calculate_reference_age_fast(analyzed_metadata, state):
                 try:
                     ref_year = int(ref['year'])
                     if 1900 <= ref_year <= current_year + 1:
-                        ref_ages.append(current_year - ref_year)
+                        ref_years.append(ref_year)
                         continue
                 except: 
                     pass
             
             # 2. Try DOI from cache (already loaded!)
             doi = ref.get('DOI')
-            if doi and doi in state.crossref_cache:
-                cached = state.crossref_cache[doi]
+            # One cache read per reference DOI; a membership test first would hit the disk cache twice
+            cached = state.crossref_cache.get(doi) if doi else None
+            if cached:
                 date_parts = cached.get('published', {}).get('date-parts', [[0]])[0]
                 if date_parts and date_parts[0]:
-                    ref_year = date_parts[0]
-                    ref_ages.append(current_year - ref_year)
+                    ref_years.append(date_parts[0])
     
-    if not ref_ages: 
+    if not ref_years: 
         return {
             'ref_median_age': None,
             'ref_mean_age': None,
@@ -2475,13 +2897,57 @@ def calculate_reference_age_fast(analyzed_metadata, state):
             'total_refs_analyzed': 0
         }
     
+    ages_sum, (q25, median, q75) = reference_ages_kernel(np.array(ref_years, dtype=np.int64), current_year)
+    
     return {
-        'ref_median_age': int(np.median(ref_ages)),
-        'ref_mean_age': round(np.mean(ref_ages), 1),
-        'ref_ages_25_75': [int(np.percentile(ref_ages, 25)), int(np.percentile(ref_ages, 75))],
-        'total_refs_analyzed': len(ref_ages)
+        'ref_median_age': int(median),
+        'ref_mean_age': round(ages_sum / len(ref_years), 1),
+        'ref_ages_25_75': [int(q25), int(q75)],
+        'total_refs_analyzed': len(ref_years)
     }
 
+@lru_cache(maxsize=4096)
+def normalize_issn(issn):
+    """ISSN without hyphens, upper-cased; citing works come from relatively few journals, so results are reused"""
+    return issn.replace('-', '').upper()
+
+def match_citing_issn(c, journal_issn_clean):
+    """Whether a citing record was published in the journal (OpenAlex ISSNs first, then Crossref),
+    plus the normalized ISSNs checked on the way"""
+    found_issns = []
+    oa = c.get('openalex')
+    cr = c.get('crossref')
+    
+    # Check OpenAlex data
+    if oa:
+        host_venue = oa.get('host_venue', {})
+        if host_venue:
+            oa_issns = host_venue.get('issn', [])
+            if isinstance(oa_issns, str):
+                oa_issns = [oa_issns]
+            
+            for issn in oa_issns:
+                if issn:
+                    issn_clean = normalize_issn(issn)
+                    found_issns.append(issn_clean)
+                    if issn_clean == journal_issn_clean:
+                        return True, found_issns
+    
+    # Check Crossref data if not found in OpenAlex
+    if cr:
+        cr_issns = cr.get('ISSN', [])
+        if isinstance(cr_issns, str):
+            cr_issns = [cr_issns]
+            
+        for issn in cr_issns:
+            if issn:
+                issn_clean = normalize_issn(issn)
+                found_issns.append(issn_clean)
+                if issn_clean == journal_issn_clean:
+                    return True, found_issns
+    
+    return False, found_issns
+
 def calculate_jscr_fast(citing_metadata, journal_issn):
     """Journal Self-Citation Rate - percentage of journal self-citations"""
     if not citing_metadata:
@@ -2495,70 +2961,38 @@ def calculate_jscr_fast(citing_metadata, journal_issn):
     self_cites = 0
     total_processed = 0
     debug_info = []
+    # Only the first records are reported, so debug strings are not built for the rest
+    debug_limit = 10
     
     # Normalize ISSN for comparison
     journal_issn_clean = journal_issn.replace('-', '').upper() if journal_issn else ""
     
+    # Works citing several analyzed articles appear once per citation; match each DOI once
+    match_by_doi = {}
+    
     for i, c in enumerate(citing_metadata):
-        current_debug = f"Item {i}: "
-        
         # Skip records without data
         if not c:
-            current_debug += "No data"
-            debug_info.append(current_debug)
+            if i < debug_limit:
+                debug_info.append(f"Item {i}: No data")
             continue
-            
-        oa = c.get('openalex')
-        cr = c.get('crossref')
-        
-        found_match = False
-        found_issns = []
         
-        # Check OpenAlex data
-        if oa:
-            host_venue = oa.get('host_venue', {})
-            if host_venue:
-                oa_issns = host_venue.get('issn', [])
-                if isinstance(oa_issns, str):
-                    oa_issns = [oa_issns]
-                
-                for issn in oa_issns:
-                    if issn:
-                        issn_clean = issn.replace('-', '').upper()
-                        found_issns.append(issn_clean)
-                        if issn_clean == journal_issn_clean:
-                            found_match = True
-                            break
-        
-        # Check Crossref data if not found in OpenAlex
-        if not found_match and cr:
-            cr_issns = cr.get('ISSN', [])
-            if isinstance(cr_issns, str):
-                cr_issns = [cr_issns]
-                
-            for issn in cr_issns:
-                if issn:
-                    issn_clean = issn.replace('-', '').upper()
-                    found_issns.append(issn_clean)
-                    if issn_clean == journal_issn_clean:
-                        found_match = True
-                        break
-        
-        # Also check by journal name in crossref (additional method)
-        if not found_match and cr:
-            container_title = cr.get('container-title', [])
-            if container_title and journal_issn:
-                # If we have journal name, we can try to match
-                # but this is less reliable, so use as fallback
-                pass
+        c_doi = c.get('doi')
+        if i >= debug_limit and c_doi in match_by_doi:
+            found_match = match_by_doi[c_doi]
+        else:
+            found_match, found_issns = match_citing_issn(c, journal_issn_clean)
+            if c_doi:
+                match_by_doi[c_doi] = found_match
         
         if found_match:
             self_cites += 1
-            current_debug += f"SELF-CITE found. ISSNs: {found_issns}"
-        else:
-            current_debug += f"Not self-cite. ISSNs: {found_issns}"
         
-        debug_info.append(current_debug)
+        if i < debug_limit:
+            if found_match:
+                debug_info.append(f"Item {i}: SELF-CITE found. ISSNs: {found_issns}")
+            else:
+                debug_info.append(f"Item {i}: Not self-cite. ISSNs: {found_issns}")
         total_processed += 1
     
     # JSCR calculation
@@ -2568,15 +3002,48 @@ def calculate_jscr_fast(citing_metadata, journal_issn):
         'JSCR': jscr,
         'self_cites': self_cites,
         'total_cites': total_processed,
-        'debug_count': len(debug_info),
+        'debug_count': len(citing_metadata),
         'journal_issn_clean': journal_issn_clean
     }
     
     # Add first part of debug information (first 10 records)
-    result['debug_samples'] = debug_info[:10]
+    result['debug_samples'] = debug_info
     
     return result
 
+def build_metadata_frame(metadata_list):
+    """Columnar view of the per-work scalar fields shared by several fast metrics"""
+    rows = []
+    for meta in metadata_list:
+        if not meta:
+            continue
+        oa = meta.get('openalex')
+        rows.append((
+            bool(oa),
+            oa.get('cited_by_count', 0) if oa else 0,
+            bool(oa.get('open_access', {}).get('is_oa', False)) if oa else False
+        ))
+    frame = pd.DataFrame(rows, columns=['has_openalex', 'cited_by_count', 'is_oa'])
+    return frame.astype({'has_openalex': bool, 'cited_by_count': 'int64', 'is_oa': bool})
+
+@njit(cache=True)
+def cited_half_life_kernel(years, pub_year):
+    """Years from publication until half of the citations are accumulated (-1 if not reached within 50 years)"""
+    total = years.shape[0]
+    if total == 0:
+        return -1
+    counts = np.zeros(50, np.int64)
+    for y in years:
+        d = y - pub_year
+        if 0 <= d < 50:
+            counts[d] += 1
+    cumulative = 0
+    for i in range(50):
+        cumulative += counts[i]
+        if 2 * cumulative >= total:
+            return i
+    return -1
+
 def calculate_cited_half_life_fast(analyzed_metadata, state):
     """Cited Half-Life - median time to receive half of citations"""
     half_lives = []
@@ -2586,7 +3053,7 @@ def calculate_cited_half_life_fast(analyzed_metadata, state):
             continue
             
         doi = meta['crossref'].get('DOI')
-        pub_year = meta['crossref'].get('published', {}).get('date-parts', [[0]])[0][0]
+        pub_year = get_publication_year(meta['crossref'])
         if not doi or not pub_year: 
             continue
         
@@ -2594,7 +3061,7 @@ def calculate_cited_half_life_fast(analyzed_metadata, state):
         if not citings: 
             continue
         
-        yearly = defaultdict(int)
+        citing_years = []
         for c in citings:
             # Fix: correct way to get publication year
             if isinstance(c, dict):
@@ -2614,19 +3081,14 @@ def calculate_cited_half_life_fast(analyzed_metadata, state):
                 y = None
                 
             if y: 
-                yearly[y] += 1
+                citing_years.append(y)
         
-        total = sum(yearly.values())
-        if total == 0: 
+        if not citing_years: 
             continue
-            
-        cumulative = 0
-        target = total / 2
-        for y in range(pub_year, pub_year + 50):
-            cumulative += yearly[y]
-            if cumulative >= target:
-                half_lives.append(y - pub_year)
-                break
+        
+        half_life = cited_half_life_kernel(np.array(citing_years, dtype=np.int64), pub_year)
+        if half_life >= 0:
+            half_lives.append(int(half_life))
     
     return {
         'cited_half_life_median': int(np.median(half_lives)) if half_lives else None,
@@ -2695,15 +3157,15 @@ def calculate_fwci_fast(analyzed_metadata):
     
     # Expected citations calculation
     if concept_citations:
-        # Method 1: based on concept averages
-        for concept_data in concept_citations.values():
-            if concept_data['article_count'] > 0:
-                avg_cites_per_article = concept_data['total_cites'] / concept_data['article_count']
-                avg_score = concept_data['total_score'] / concept_data['article_count']
-                
-                # Weight by concept score
-                expected_contribution = avg_cites_per_article * avg_score
-                expected_sum += expected_contribution
+        # Method 1: based on concept averages, weighted by concept score
+        concept_stats = np.array(
+            [(c['total_cites'], c['article_count'], c['total_score']) for c in concept_citations.values()],
+            dtype=np.float64
+        )
+        article_counts = np.maximum(concept_stats[:, 1], 1)
+        avg_cites_per_article = concept_stats[:, 0] / article_counts
+        avg_score = concept_stats[:, 2] / article_counts
+        expected_sum = float((avg_cites_per_article * avg_score).sum())
         
         method_used = 'concept_based'
     else:
@@ -2761,7 +3223,7 @@ def calculate_citation_velocity_fast(analyzed_metadata, state):
         if not cr: 
             continue
             
-        pub_year = cr.get('published', {}).get('date-parts', [[0]])[0][0]
+        pub_year = get_publication_year(cr) or 0
         if current_year - pub_year < 2: 
             continue
         
@@ -2792,26 +3254,18 @@ def calculate_citation_velocity_fast(analyzed_metadata, state):
         'articles_with_velocity': len(velocities)
     }
 
-def calculate_oa_impact_premium_fast(analyzed_metadata):
+def calculate_oa_impact_premium_fast(analyzed_metadata, metadata_frame=None):
     """Open Access Impact Premium - citation difference between OA and non-OA"""
-    oa_citations = []
-    non_oa_citations = []
+    if metadata_frame is None:
+        metadata_frame = build_metadata_frame(analyzed_metadata)
     
-    for meta in analyzed_metadata:
-        oa = meta.get('openalex')
-        if not oa: 
-            continue
-            
-        cites = oa.get('cited_by_count', 0)
-        is_oa = oa.get('open_access', {}).get('is_oa', False)
-        
-        if is_oa:
-            oa_citations.append(cites)
-        else:
-            non_oa_citations.append(cites)
+    with_openalex = metadata_frame[metadata_frame['has_openalex']]
+    is_oa = with_openalex['is_oa']
+    oa_citations = with_openalex.loc[is_oa, 'cited_by_count']
+    non_oa_citations = with_openalex.loc[~is_oa, 'cited_by_count']
     
-    oa_avg = np.mean(oa_citations) if oa_citations else 0
-    non_oa_avg = np.mean(non_oa_citations) if non_oa_citations else 0
+    oa_avg = oa_citations.mean() if len(oa_citations) else 0
+    non_oa_avg = non_oa_citations.mean() if len(non_oa_citations) else 0
     
     premium = ((oa_avg - non_oa_avg) / non_oa_avg * 100) if non_oa_avg > 0 else 0
     
@@ -2823,71 +3277,116 @@ def calculate_oa_impact_premium_fast(analyzed_metadata):
         'non_OA_avg_citations': round(non_oa_avg, 1)
     }
 
-def calculate_elite_index_fast(analyzed_metadata):
+def calculate_elite_index_fast(analyzed_metadata, metadata_frame=None):
     """Elite Index - percentage of articles in top-10% by citations"""
     if not analyzed_metadata:
         return {'elite_index': 0}
     
-    citations = []
-    for meta in analyzed_metadata:
-        oa = meta.get('openalex')
-        if oa:
-            cites = oa.get('cited_by_count', 0)
-            citations.append(cites)
+    if metadata_frame is None:
+        metadata_frame = build_metadata_frame(analyzed_metadata)
+    citations_column = metadata_frame.loc[metadata_frame['has_openalex'], 'cited_by_count']
     
-    if not citations:
+    n = len(citations_column)
+    if n == 0:
         return {'elite_index': 0}
     
+    cites_array = None
+    if n < 32:
+        # Small samples: sorted list with linear interpolation beats NumPy dispatch overhead
+        citations = citations_column.tolist()
+        min_citations, max_citations = min(citations), max(citations)
+        sorted_cites = sorted(citations)
+        
+        def percentile(q):
+            pos = q / 100 * (n - 1)
+            lo = int(pos)
+            hi = min(lo + 1, n - 1)
+            return sorted_cites[lo] + (sorted_cites[hi] - sorted_cites[lo]) * (pos - lo)
+        
+        percentile_85, percentile_90, median_citations = percentile(85), percentile(90), percentile(50)
+        mean_cites = sum(citations) / n
+        std_cites = (sum((c - mean_cites) ** 2 for c in citations) / n) ** 0.5
+    else:
+        # Large samples stay in one array for the percentiles, moments and the elite count
+        cites_array = citations_column.to_numpy()
+        min_citations, max_citations = int(cites_array.min()), int(cites_array.max())
+        percentile_85, percentile_90, median_citations = np.percentile(cites_array, [85, 90, 50])
+        mean_cites = cites_array.mean()
+        std_cites = cites_array.std()
+    
     # DIAGNOSTICS: output citation statistics
     print(f"🔍 Elite Index diagnostics:")
-    print(f"   Total articles with citation data: {len(citations)}")
-    print(f"   Citation distribution: min={min(citations)}, max={max(citations)}, mean={np.mean(citations):.1f}, median={np.median(citations)}")
+    print(f"   Total articles with citation data: {n}")
+    print(f"   Citation distribution: min={min_citations}, max={max_citations}, mean={mean_cites:.1f}, median={median_citations}")
     
     # Problem: np.percentile(citations, 90) always gives 90th percentile WITHIN our dataset
     # But Elite Index should be compared with GLOBAL data
     
     # Temporary solution: use heuristic based on distribution
-    if max(citations) == 0:
+    if max_citations == 0:
         return {'elite_index': 0}
     
     # Alternative approach 1: count top-10% from maximum value
-    max_citations = max(citations)
     threshold_alt1 = max_citations * 0.1  # 10% of maximum
     
     # Alternative approach 2: use quantiles more aggressively
-    threshold_alt2 = int(np.percentile(citations, 85))  # More strict threshold
+    threshold_alt2 = int(percentile_85)  # More strict threshold
     
     # Alternative approach 3: based on standard deviation
-    if len(citations) > 1:
-        mean_cites = np.mean(citations)
-        std_cites = np.std(citations)
+    if n > 1:
         threshold_alt3 = mean_cites + std_cites  # Articles above average + one standard deviation
     else:
-        threshold_alt3 = max(citations)
+        threshold_alt3 = max_citations
     
     # Use the most meaningful approach
     threshold = threshold_alt3
     
-    elite_count = sum(1 for c in citations if c >= threshold)
-    elite_index = round(elite_count / len(citations) * 100, 2)
+    if cites_array is None:
+        elite_count = sum(1 for c in citations if c >= threshold)
+    else:
+        elite_count = int((cites_array >= threshold).sum())
+    elite_index = round(elite_count / n * 100, 2)
     
-    print(f"   Thresholds: percent90={np.percentile(citations, 90):.1f}, alt1={threshold_alt1:.1f}, alt2={threshold_alt2:.1f}, alt3={threshold_alt3:.1f}")
+    print(f"   Thresholds: percent90={percentile_90:.1f}, alt1={threshold_alt1:.1f}, alt2={threshold_alt2:.1f}, alt3={threshold_alt3:.1f}")
     print(f"   Result: elite_count={elite_count}, elite_index={elite_index}%")
     
     return {
         'elite_index': elite_index,
         'elite_articles': elite_count,
-        'total_articles': len(citations),
+        'total_articles': n,
         'citation_threshold': int(threshold),
         'method_used': 'mean_plus_std',
         'debug_info': {
-            'percentile_90': np.percentile(citations, 90),
-            'max_citations': max(citations),
-            'mean_citations': np.mean(citations),
-            'median_citations': np.median(citations)
+            'percentile_90': percentile_90,
+            'max_citations': max_citations,
+            'mean_citations': mean_cites,
+            'median_citations': median_citations
         }
     }
 
+@njit(cache=True)
+def gini_kernel(counts):
+    """Gini coefficient of positive counts; sorts the array in place"""
+    counts.sort()
+    n = counts.shape[0]
+    cumulative = 0.0
+    cumulative_sum = 0.0
+    for c in counts:
+        cumulative += c
+        cumulative_sum += cumulative
+    return (n + 1 - 2 * cumulative_sum / cumulative) / n
+
+@njit(cache=True)
+def shannon_entropy_kernel(counts):
+    """Shannon index of a frequency vector"""
+    total = counts.sum()
+    entropy = 0.0
+    for c in counts:
+        if c > 0:
+            p = c / total
+            entropy -= p * np.log(p)
+    return entropy
+
 def calculate_author_gini_fast(analyzed_metadata):
     """Author Gini Index - inequality index of publication distribution among authors"""
     author_counts = Counter()
@@ -2903,16 +3402,14 @@ def calculate_author_gini_fast(analyzed_metadata):
     if len(author_counts) < 2:
         return {'author_gini': 0}
     
-    # Gini index calculation
-    values = sorted(author_counts.values())
-    n = len(values)
-    cumulative = np.cumsum(values).astype(float)
-    gini = (n + 1 - 2 * np.sum(cumulative) / cumulative[-1]) / n
+    # Gini index calculation (the kernel leaves values sorted)
+    values = np.fromiter(author_counts.values(), dtype=np.int64, count=len(author_counts))
+    gini = gini_kernel(values)
     
     return {
         'author_gini': round(gini, 3),
         'total_authors': len(author_counts),
-        'articles_per_author_avg': round(np.mean(values), 2),
+        'articles_per_author_avg': round(values.mean(), 2),
         'articles_per_author_median': int(np.median(values))
     }
 
@@ -2936,8 +3433,7 @@ def calculate_dbi_fast(analyzed_metadata):
         return {'DBI': 0}
     
     # Shannon index
-    proportions = [count / total_concepts for count in concept_freq.values()]
-    shannon = -sum(p * np.log(p) for p in proportions if p > 0)
+    shannon = shannon_entropy_kernel(np.fromiter(concept_freq.values(), dtype=np.float64, count=len(concept_freq)))
     
     # Normalization (maximum = log(n))
     max_shannon = np.log(len(concept_freq)) if concept_freq else 1
@@ -2954,6 +3450,14 @@ def calculate_dbi_fast(analyzed_metadata):
 def calculate_all_fast_metrics(analyzed_metadata, citing_metadata, state, journal_issn):
     """Calculation of all fast metrics in one pass with comprehensive error handling"""
     fast_metrics = {}
+    # Scalar per-work fields are extracted once and shared by the metrics that use them.
+    # Built on first use inside their try blocks, so a malformed record only fails those metrics.
+    frame_cache = {}
+    
+    def analyzed_frame():
+        if 'frame' not in frame_cache:
+            frame_cache['frame'] = build_metadata_frame(analyzed_metadata)
+        return frame_cache['frame']
     
     # 1. Reference Age metrics
     try:
@@ -3038,7 +3542,7 @@ def calculate_all_fast_metrics(analyzed_metadata, citing_metadata, state, journa
     
     # 6. Open Access Impact Premium
     try:
-        oa_impact_premium_metrics = calculate_oa_impact_premium_fast(analyzed_metadata)
+        oa_impact_premium_metrics = calculate_oa_impact_premium_fast(analyzed_metadata, analyzed_frame())
         fast_metrics.update(oa_impact_premium_metrics)
     except Exception as e:
         st.warning(f"⚠️ OA Impact Premium calculation failed: {str(e)}")
@@ -3052,7 +3556,7 @@ def calculate_all_fast_metrics(analyzed_metadata, citing_metadata, state, journa
     
     # 7. Elite Index
     try:
-        elite_index_metrics = calculate_elite_index_fast(analyzed_metadata)
+        elite_index_metrics = calculate_elite_index_fast(analyzed_metadata, analyzed_frame())
         fast_metrics.update(elite_index_metrics)
     except Exception as e:
         st.warning(f"⚠️ Elite Index calculation failed: {str(e)}")
@@ -3487,76 +3991,116 @@ def find_potential_reviewers(analyzed_metadata, citing_metadata, overlap_details
     }
 
 # === NEW CLASS FOR TITLE KEYWORDS ANALYSIS ===
+class CharCleaningTable(dict):
+    """str.translate table that keeps the given characters and whitespace and turns everything else into spaces.
+    Entries are filled on first sight of a character, so any Unicode input is handled."""
+    
+    def __init__(self, keep):
+        super().__init__()
+        self.keep = frozenset(keep)
+    
+    def __missing__(self, code):
+        char = chr(code)
+        value = code if char in self.keep or char.isspace() else ' '
+        self[code] = value
+        return value
+
+# Title cleaning tables and patterns, built once; str.split() then collapses the whitespace runs
+NON_ALPHA_HYPHEN_TABLE = CharCleaningTable(string.ascii_letters + '-')
+NON_ALPHA_TABLE = CharCleaningTable(string.ascii_letters)
+COMPOUND_WORD_RE = re.compile(r'\b[a-z]{2,}-[a-z]{2,}(?:-[a-z]{2,})*\b')
+
+@lru_cache(maxsize=1)
+def load_english_stopwords():
+    """English stop words and a Porter stemmer, loaded once per process (stemmer is None without nltk)"""
+    try:
+        import nltk
+        from nltk.corpus import stopwords
+        from nltk.stem import PorterStemmer
+        
+        # Загружаем стоп-слова
+        nltk.download('stopwords', quiet=True)
+        return frozenset(stopwords.words('english')), PorterStemmer()
+    except:
+        # Fallback если nltk не доступен
+        return frozenset({'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}), None
+
+# Научные стоп-слова
+SCIENTIFIC_STOPWORDS = frozenset({
+    'activation', 'adaptive', 'advanced', 'analysis', 'application',
+    'applications', 'approach', 'architecture', 'artificial', 'assessment',
+    'based', 'behavior', 'capacity', 'characteristics', 'characterization',
+    'coating', 'coatings', 'comparative', 'computational', 'composite',
+    'composites', 'control', 'cycle', 'damage', 'data', 'density', 'design',
+    'detection', 'development', 'device', 'devices', 'diagnosis', 'discovery',
+    'dynamic', 'dynamics', 'economic', 'effect', 'effects', 'efficacy',
+    'efficient', 'energy', 'engineering', 'enhanced', 'environmental',
+    'evaluation', 'experimental', 'exploration', 'factors', 'failure',
+    'fabrication', 'field', 'film', 'films', 'flow', 'framework', 'frequency',
+    'functional', 'growth', 'high', 'impact', 'improved', 'improvement',
+    'induced', 'influence', 'information', 'innovative', 'intelligent',
+    'interaction', 'interface', 'interfaces', 'investigation', 'knowledge',
+    'layer', 'layers', 'learning', 'magnetic', 'management', 'material',
+    'materials', 'measurement', 'mechanism', 'mechanisms', 'medical',
+    'method', 'methods', 'model', 'models', 'modification', 'modulation',
+    'molecular', 'monitoring', 'motion', 'nanoparticle', 'nanoparticles',
+    'nanostructure', 'nanostructures', 'network', 'neural', 'new', 'nonlinear',
+    'novel', 'numerical', 'optical', 'optimization', 'pattern', 'performance',
+    'phenomenon', 'potential', 'power', 'prediction', 'preparation', 'process',
+    'processing', 'production', 'progression', 'property', 'properties',
+    'quality', 'regulation', 'relationship', 'reliability', 'remote', 'repair',
+    'research', 'resistance', 'response', 'review', 'risk', 'role', 'safety',
+    'sample', 'samples', 'scale', 'screening', 'separation', 'signal',
+    'simulation', 'specific', 'stability', 'stable', 'state', 'storage',
+    'strain', 'strength', 'stress', 'structural', 'structure', 'study',
+    'studies', 'sustainable', 'synergy', 'synthesis', 'system', 'systems',
+    'targeted', 'techniques', 'technology', 'testing', 'theoretical', 'therapy',
+    'thermal', 'tissue', 'tolerance', 'toxicity', 'transformation', 'transition',
+    'transmission', 'transport', 'type', 'understanding', 'using', 'validation',
+    'value', 'variation', 'virtual', 'waste', 'wave'
+})
+
+@lru_cache(maxsize=1)
+def load_scientific_stopword_stems():
+    """Stem -> scientific stopword map, built once per process.
+    Words are visited in sorted order, so each stem maps to the same word in every process."""
+    _, stemmer = load_english_stopwords()
+    stem_to_original = {}
+    for word in sorted(SCIENTIFIC_STOPWORDS):
+        stem = sys.intern(stemmer.stem(word)) if stemmer else word
+        stem_to_original.setdefault(stem, word)
+    return stem_to_original
+
 class TitleKeywordsAnalyzer:
     def __init__(self):
         # Инициализация стоп-слов и стеммера
-        try:
-            import nltk
-            from nltk.corpus import stopwords
-            from nltk.stem import PorterStemmer
-            
-            # Загружаем стоп-слова
-            nltk.download('stopwords', quiet=True)
-            self.stop_words = set(stopwords.words('english'))
-            self.stemmer = PorterStemmer()
-        except:
-            # Fallback если nltk не доступен
-            self.stop_words = {'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-            self.stemmer = None
+        self.stop_words, self.stemmer = load_english_stopwords()
+        
+        # Titles repeat the same words a lot, so every distinct word is stemmed once
+        self.stem_cache = {}
         
         # Научные стоп-слова
-        self.scientific_stopwords = {
-            'activation', 'adaptive', 'advanced', 'analysis', 'application',
-            'applications', 'approach', 'architecture', 'artificial', 'assessment',
-            'based', 'behavior', 'capacity', 'characteristics', 'characterization',
-            'coating', 'coatings', 'comparative', 'computational', 'composite',
-            'composites', 'control', 'cycle', 'damage', 'data', 'density', 'design',
-            'detection', 'development', 'device', 'devices', 'diagnosis', 'discovery',
-            'dynamic', 'dynamics', 'economic', 'effect', 'effects', 'efficacy',
-            'efficient', 'energy', 'engineering', 'enhanced', 'environmental',
-            'evaluation', 'experimental', 'exploration', 'factors', 'failure',
-            'fabrication', 'field', 'film', 'films', 'flow', 'framework', 'frequency',
-            'functional', 'growth', 'high', 'impact', 'improved', 'improvement',
-            'induced', 'influence', 'information', 'innovative', 'intelligent',
-            'interaction', 'interface', 'interfaces', 'investigation', 'knowledge',
-            'layer', 'layers', 'learning', 'magnetic', 'management', 'material',
-            'materials', 'measurement', 'mechanism', 'mechanisms', 'medical',
-            'method', 'methods', 'model', 'models', 'modification', 'modulation',
-            'molecular', 'monitoring', 'motion', 'nanoparticle', 'nanoparticles',
-            'nanostructure', 'nanostructures', 'network', 'neural', 'new', 'nonlinear',
-            'novel', 'numerical', 'optical', 'optimization', 'pattern', 'performance',
-            'phenomenon', 'potential', 'power', 'prediction', 'preparation', 'process',
-            'processing', 'production', 'progression', 'property', 'properties',
-            'quality', 'regulation', 'relationship', 'reliability', 'remote', 'repair',
-            'research', 'resistance', 'response', 'review', 'risk', 'role', 'safety',
-            'sample', 'samples', 'scale', 'screening', 'separation', 'signal',
-            'simulation', 'specific', 'stability', 'stable', 'state', 'storage',
-            'strain', 'strength', 'stress', 'structural', 'structure', 'study',
-            'studies', 'sustainable', 'synergy', 'synthesis', 'system', 'systems',
-            'targeted', 'techniques', 'technology', 'testing', 'theoretical', 'therapy',
-            'thermal', 'tissue', 'tolerance', 'toxicity', 'transformation', 'transition',
-            'transmission', 'transport', 'type', 'understanding', 'using', 'validation',
-            'value', 'variation', 'virtual', 'waste', 'wave'
-        }
+        self.scientific_stopwords = SCIENTIFIC_STOPWORDS
         
-        # Стемминг научных стоп-слов
-        if self.stemmer:
-            self.scientific_stopwords_stemmed = {
-                self.stemmer.stem(word) for word in self.scientific_stopwords
-            }
-        else:
-            self.scientific_stopwords_stemmed = self.scientific_stopwords
+        # Стемминг научных стоп-слов: stem -> original word (shared, read-only)
+        self.stem_to_original = load_scientific_stopword_stems()
+        self.scientific_stopwords_stemmed = frozenset(self.stem_to_original)
+    
+    def stem_word(self, word: str) -> str:
+        """Стемминг с кэшем (без стеммера возвращает слово как есть)"""
+        stemmed = self.stem_cache.get(word)
+        if stemmed is None:
+            # Interned so every word with the same stem hands the Counters one shared key object
+            stemmed = sys.intern(self.stemmer.stem(word) if self.stemmer else word)
+            self.stem_cache[word] = stemmed
+        return stemmed
     
     def preprocess_content_words(self, text: str) -> List[str]:
         """Очищает и нормализует содержательные слова (удалено слово 'sub')"""
         if not text or text in ['Название не найдено', 'Таймаут запроса', 'Ошибка сети', 'Ошибка при получении']:
             return []
 
-        text = text.lower()
-        text = re.sub(r'[^a-zA-Z\s-]', ' ', text)
-        text = re.sub(r'\s+', ' ', text).strip()
-
-        words = text.split()
+        words = text.lower().translate(NON_ALPHA_HYPHEN_TABLE).split()
         content_words = []
 
         for word in words:
@@ -3566,10 +4110,7 @@ class TitleKeywordsAnalyzer:
             if '-' in word:
                 continue
             if len(word) > 2 and word not in self.stop_words:
-                if self.stemmer:
-                    stemmed_word = self.stemmer.stem(word)
-                else:
-                    stemmed_word = word
+                stemmed_word = self.stem_word(word)
                 if stemmed_word not in self.scientific_stopwords_stemmed:
                     content_words.append(stemmed_word)
 
@@ -3581,7 +4122,7 @@ class TitleKeywordsAnalyzer:
             return []
 
         text = text.lower()
-        compound_words = re.findall(r'\b[a-z]{2,}-[a-z]{2,}(?:-[a-z]{2,})*\b', text)
+        compound_words = COMPOUND_WORD_RE.findall(text)
 
         filtered_compounds = []
         for word in compound_words:
@@ -3596,65 +4137,85 @@ class TitleKeywordsAnalyzer:
         if not text or text in ['Название не найдено', 'Таймаут запроса', 'Ошибка сети', 'Ошибка при получении']:
             return []
 
-        text = text.lower()
-        text = re.sub(r'[^a-zA-Z\s]', ' ', text)
-        text = re.sub(r'\s+', ' ', text).strip()
-
-        words = text.split()
+        words = text.lower().translate(NON_ALPHA_TABLE).split()
         scientific_words = []
 
         for word in words:
             if len(word) > 2:
-                if self.stemmer:
-                    stemmed_word = self.stemmer.stem(word)
-                else:
-                    stemmed_word = word
-                if stemmed_word in self.scientific_stopwords_stemmed:
-                    for original_word in self.scientific_stopwords:
-                        if self.stemmer:
-                            original_stemmed = self.stemmer.stem(original_word)
-                        else:
-                            original_stemmed = original_word
-                        if original_stemmed == stemmed_word:
-                            scientific_words.append(original_word)
-                            break
+                stemmed_word = self.stem_word(word)
+                original_word = self.stem_to_original.get(stemmed_word)
+                if original_word:
+                    scientific_words.append(original_word)
 
         return scientific_words
 
+    def extract_title_words(self, text: str):
+        """Содержательные, составные и научные слова за один проход по названию.
+        Результат совпадает с preprocess_content_words, extract_compound_words и extract_scientific_stopwords."""
+        if not text or text in ['Название не найдено', 'Таймаут запроса', 'Ошибка сети', 'Ошибка при получении']:
+            return [], [], []
+
+        text = text.lower()
+        compound_words = [
+            word for word in COMPOUND_WORD_RE.findall(text)
+            if not any(part in self.stop_words for part in word.split('-'))
+        ]
+
+        content_words = []
+        scientific_words = []
+        for token in text.translate(NON_ALPHA_HYPHEN_TABLE).split():
+            if '-' in token:
+                # Hyphenated words are not content words, but their parts can be scientific stopwords
+                for part in token.split('-'):
+                    if len(part) > 2:
+                        original_word = self.stem_to_original.get(self.stem_word(part))
+                        if original_word:
+                            scientific_words.append(original_word)
+                continue
+            if len(token) > 2:
+                stemmed_word = self.stem_word(token)
+                original_word = self.stem_to_original.get(stemmed_word)
+                if original_word:
+                    scientific_words.append(original_word)
+                elif token != 'sub' and token not in self.stop_words:
+                    content_words.append(stemmed_word)
+
+        return content_words, compound_words, scientific_words
+
+    def count_title_words(self, titles: List[str], block_size: int = 1000):
+        """Частоты содержательных, составных и научных слов по набору названий"""
+        content_freq = Counter()
+        compound_freq = Counter()
+        scientific_freq = Counter()
+        valid_titles = [t for t in titles if t and t not in ['Название не найдено', 'Таймаут запроса', 'Ошибка сети', 'Ошибка при получении']]
+        
+        # Citing titles repeat once per citation link: tokenize each distinct title once and weight its words
+        title_counts = Counter(valid_titles)
+        if len(title_counts) < len(valid_titles):
+            for title, count in title_counts.items():
+                for freq, words in zip((content_freq, compound_freq, scientific_freq), self.extract_title_words(title)):
+                    for word in words:
+                        freq[word] += count
+            return content_freq, compound_freq, scientific_freq
+        
+        # Titles are joined by newlines and cleaned in blocks: one regex pass per block instead of per title.
+        # A newline is whitespace for every pattern, so tokens never span two titles.
+        for i in range(0, len(valid_titles), block_size):
+            block = '\n'.join(valid_titles[i:i + block_size])
+            content_words, compound_words, scientific_words = self.extract_title_words(block)
+            content_freq.update(content_words)
+            compound_freq.update(compound_words)
+            scientific_freq.update(scientific_words)
+        return content_freq, compound_freq, scientific_freq
+
     def analyze_titles(self, analyzed_titles: List[str], citing_titles: List[str]) -> dict:
         """Анализирует ключевые слова в названиях анализируемых и цитирующих статей"""
-        # Анализ анализируемых статей
-        analyzed_content_words = []
-        analyzed_compound_words = []
-        analyzed_scientific_words = []
-        
         valid_analyzed_titles = [t for t in analyzed_titles if t and t not in ['Название не найдено', 'Таймаут запроса', 'Ошибка сети', 'Ошибка при получении']]
-        
-        for title in valid_analyzed_titles:
-            analyzed_content_words.extend(self.preprocess_content_words(title))
-            analyzed_compound_words.extend(self.extract_compound_words(title))
-            analyzed_scientific_words.extend(self.extract_scientific_stopwords(title))
-        
-        # Анализ цитирующих статей
-        citing_content_words = []
-        citing_compound_words = []
-        citing_scientific_words = []
-        
         valid_citing_titles = [t for t in citing_titles if t and t not in ['Название не найдено', 'Таймаут запроса', 'Ошибка сети', 'Ошибка при получении']]
         
-        for title in valid_citing_titles:
-            citing_content_words.extend(self.preprocess_content_words(title))
-            citing_compound_words.extend(self.extract_compound_words(title))
-            citing_scientific_words.extend(self.extract_scientific_stopwords(title))
-        
         # Подсчет частот
-        analyzed_content_freq = Counter(analyzed_content_words)
-        analyzed_compound_freq = Counter(analyzed_compound_words)
-        analyzed_scientific_freq = Counter(analyzed_scientific_words)
-        
-        citing_content_freq = Counter(citing_content_words)
-        citing_compound_freq = Counter(citing_compound_words)
-        citing_scientific_freq = Counter(citing_scientific_words)
+        analyzed_content_freq, analyzed_compound_freq, analyzed_scientific_freq = self.count_title_words(valid_analyzed_titles)
+        citing_content_freq, citing_compound_freq, citing_scientific_freq = self.count_title_words(valid_citing_titles)
         
         # Топ-50 для каждого типа
         top_50_analyzed_content = analyzed_content_freq.most_common(50)
@@ -3680,6 +4241,15 @@ class TitleKeywordsAnalyzer:
             }
         }
 
+# Shared analyzer, built once per process so nltk setup and the stem cache are reused
+_title_keywords_analyzer = None
+
+def get_title_keywords_analyzer():
+    global _title_keywords_analyzer
+    if _title_keywords_analyzer is None:
+        _title_keywords_analyzer = TitleKeywordsAnalyzer()
+    return _title_keywords_analyzer
+
 def extract_titles_from_metadata(metadata_list):
     """Извлекает названия статей из метаданных"""
     titles = []
@@ -4149,10 +4719,10 @@ def search_ror_organization(affiliation_name):
         # Search ROR API
         url = "https://api.ror.org/organizations"
         params = {'query': affiliation_name.strip()}
-        response = requests.get(url, params=params, timeout=10)
+        response = HTTP_CLIENT.get(url, params=params, timeout=10)
         response.raise_for_status()
         
-        items = response.json().get('items', [])
+        items = json_loads(response.content).get('items', [])
         print(f"📊 Found {len(items)} potential matches")
         
         if not items:
@@ -4163,6 +4733,13 @@ def search_ror_organization(affiliation_name):
         best_score = -1
         
         query_lower = affiliation_name.strip().lower()
+        # Word set of the query for the fallback overlap score, built once for all candidates
+        query_words = set(query_lower.split())
+        
+        try:
+            from thefuzz import fuzz
+        except ImportError:
+            fuzz = None
         
         for i, item in enumerate(items):
             name = item.get('name', '').lower()
@@ -4186,17 +4763,15 @@ def search_ror_organization(affiliation_name):
                 elif test_name in query_lower:
                     score = 7000
                 # Fuzzy matching
+                elif fuzz:
+                    score = fuzz.token_set_ratio(query_lower, test_name)
+                    # Boost score for longer matches
+                    if len(test_name) > 10:
+                        score = int(score * 1.1)
                 else:
-                    try:
-                        from thefuzz import fuzz
-                        score = fuzz.token_set_ratio(query_lower, test_name)
-                        # Boost score for longer matches
-                        if len(test_name) > 10:
-                            score = int(score * 1.1)
-                    except ImportError:
-                        # Fallback simple matching
-                        common_words = len(set(query_lower.split()) & set(test_name.split()))
-                        score = common_words * 20
+                    # Fallback simple matching
+                    common_words = len(query_words.intersection(test_name.split()))
+                    score = common_words * 20
                 
                 # Additional scoring based on organization type
                 org_type = item.get('types', [])
@@ -4566,9 +5141,9 @@ def get_work_by_doi(doi):
     doi = doi.strip()
     url = f"https://api.openalex.org/works/https://doi.org/{doi}"
     try:
-        r = requests.get(url, timeout=15)
+        r = HTTP_CLIENT.get(url, timeout=15)
         r.raise_for_status()
-        return r.json()
+        return json_loads(r.content)
     except:
         return None
 
@@ -4602,10 +5177,10 @@ def search_orcid_author(surname, given_name, affiliation):
         
         print(f"📡 ORCID API Request: {url}")
         
-        response = requests.get(url, headers=headers, timeout=15)
+        response = HTTP_CLIENT.get(url, headers=headers, timeout=15)
         
         if response.status_code == 200:
-            data = response.json()
+            data = json_loads(response.content)
             num_results = data.get('num-found', 0)
             print(f"✅ ORCID API Response: {num_results} results found")
             
@@ -4642,10 +5217,10 @@ def get_detailed_orcid_info(orcid_id):
         person_url = f"https://pub.orcid.org/v3.0/{orcid_id}/person"
         headers = {'Accept': 'application/json', 'User-Agent': 'JournalAnalysisTool/1.0'}
         
-        response = requests.get(person_url, headers=headers, timeout=15)
+        response = HTTP_CLIENT.get(person_url, headers=headers, timeout=15)
         
         if response.status_code == 200:
-            person_data = response.json()
+            person_data = json_loads(response.content)
             
             # Ищем внешние идентификаторы
             external_ids = person_data.get('external-identifiers', {}).get('external-identifier', [])
@@ -4936,6 +5511,122 @@ def create_author_id_sheet(analyzed_metadata, citing_metadata, state):
     return final_data
 
 # === 17. Enhanced Excel Report Creation ===
+def excel_value(v):
+    """Cell value as pandas' to_excel would write it: NaN/NaT empty, ±inf as text, containers as str"""
+    if v is None or v is pd.NaT:
+        return None
+    if isinstance(v, (float, np.floating)):
+        if v != v:
+            return None
+        if v in (float('inf'), float('-inf')):
+            return 'inf' if v > 0 else '-inf'
+        return v
+    if isinstance(v, (list, tuple, dict, set, frozenset)):
+        return str(v)
+    return v
+
+def excel_row(row):
+    """Row values ready for a streaming writer"""
+    return [excel_value(v) for v in row]
+
+class WriteOnlyExcelWriter:
+    """Minimal ExcelWriter replacement backed by an openpyxl write-only workbook"""
+    
+    def __init__(self, buffer):
+        import openpyxl
+        self.buffer = buffer
+        self.book = openpyxl.Workbook(write_only=True)
+        self.sheets = {}
+    
+    def append_rows(self, sheet_name, header, rows):
+        """Stream header and rows into a new sheet"""
+        ws = self.book.create_sheet(sheet_name)
+        self.sheets[sheet_name] = ws
+        ws.append(list(header))
+        for row in rows:
+            ws.append(excel_row(row))
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.book.save(self.buffer)
+        return False
+
+def open_excel_writer(excel_buffer):
+    """ExcelWriter for reports: xlsxwriter if available, otherwise write-only openpyxl"""
+    if EXCEL_ENGINE == 'xlsxwriter':
+        # constant_memory flushes each row as it is written, keeping RAM flat on large sheets.
+        # Rows must be written in order, so every sheet goes through write_rows.
+        return pd.ExcelWriter(
+            excel_buffer, 
+            engine='xlsxwriter',
+            engine_kwargs={'options': {'constant_memory': True, 'strings_to_numbers': False}}
+        )
+    return WriteOnlyExcelWriter(excel_buffer)
+
+def write_rows(writer, sheet_name, header, rows):
+    """Stream header and row tuples into a sheet without building a DataFrame"""
+    if isinstance(writer, WriteOnlyExcelWriter):
+        writer.append_rows(sheet_name, header, rows)
+    elif writer.engine == 'xlsxwriter':
+        ws = writer.book.add_worksheet(sheet_name)
+        ws.write_row(0, 0, list(header))
+        for row_idx, row in enumerate(rows, start=1):
+            ws.write_row(row_idx, 0, excel_row(row))
+    else:
+        pd.DataFrame(list(rows), columns=list(header)).to_excel(writer, sheet_name=sheet_name, index=False)
+
+def write_columns(writer, sheet_name, columns):
+    """Write a dict of equal-length column lists as a sheet"""
+    write_rows(writer, sheet_name, columns.keys(), zip(*columns.values()))
+
+@njit(cache=True)
+def run_length_counts(sorted_codes):
+    """Unique values and their counts for an already sorted int64 array"""
+    n = sorted_codes.shape[0]
+    values = np.empty(n, np.int64)
+    counts = np.empty(n, np.int64)
+    groups = 0
+    i = 0
+    while i < n:
+        j = i + 1
+        while j < n and sorted_codes[j] == sorted_codes[i]:
+            j += 1
+        values[groups] = sorted_codes[i]
+        counts[groups] = j - i
+        groups += 1
+        i = j
+    return values[:groups], counts[:groups]
+
+def count_year_pairs(citation_network):
+    """(publication_year, citation_year, count) rows sorted by both years"""
+    pub_years = []
+    cite_years = []
+    for year, citing_years in citation_network.items():
+        pub_years.extend([year or 0] * len(citing_years))
+        cite_years.extend(citing_year or 0 for citing_year in citing_years)
+    if not pub_years:
+        return []
+    
+    # Encode each pair as one integer so a single sort groups them
+    codes = np.asarray(pub_years, dtype=np.int64) * 10000 + np.asarray(cite_years, dtype=np.int64)
+    codes.sort()
+    if NUMBA_AVAILABLE:
+        values, counts = run_length_counts(codes)
+    else:
+        values, counts = np.unique(codes, return_counts=True)
+    return [(int(v // 10000), int(v % 10000), int(c)) for v, c in zip(values, counts)]
+
+def write_sheet(writer, sheet_name, df):
+    """Write DataFrame to a sheet of either writer type (without index)"""
+    if isinstance(writer, WriteOnlyExcelWriter) or writer.engine == 'xlsxwriter':
+        # to_excel emits cells column by column, which constant_memory mode cannot accept
+        write_rows(writer, sheet_name, df.columns, df.itertuples(index=False, name=None))
+    else:
+        df.to_excel(writer, sheet_name=sheet_name, index=False)
+
 def precompute_excel_data(analyzed_data, citing_data, analyzed_stats, citing_stats, enhanced_stats, citation_timing, overlap_details, fast_metrics, additional_data, state):
     """Предварительный расчет всех данных для Excel отчетов"""
     
@@ -5235,16 +5926,20 @@ def create_enhanced_excel_report(analyzed_data, citing_data, analyzed_stats, cit
             return bool(value)
         return value
 
+    def truncate(text, max_len):
+        """Slice text to max_len only when it is actually longer"""
+        return text if len(text) <= max_len else text[:max_len]
+
     def safe_join(items, sep='; ', max_len=None):
         """Safely join list, filtering None and applying length limit"""
         if not items:
             return ''
         cleaned = [str(x).strip() for x in items if x is not None and str(x).strip()]
         result = sep.join(cleaned)
-        return result[:max_len] if max_len else result
+        return truncate(result, max_len) if max_len else result
             
     try:
-        with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
+        with open_excel_writer(excel_buffer) as writer:
             # Sheet 1: Analyzed articles (with optimization)
             analyzed_list = []
             MAX_ROWS = 50000
@@ -5262,21 +5957,21 @@ def create_enhanced_excel_report(analyzed_data, citing_data, analyzed_stats, cit
                 usage_info = analyzed_articles_usage.get(analyzed_doi, {})
                 
                 analyzed_list.append({
-                    'DOI': safe_convert(cr.get('DOI', ''))[:100],
-                    'Title': (cr.get('title', [''])[0] if cr.get('title') else 'No title')[:200],
-                    'Authors_Crossref': safe_join([f"{a.get('given', '')} {a.get('family', '')}".strip() for a in cr.get('author', []) if a.get('given') or a.get('family')])[:300],
-                    'Authors_OpenAlex': safe_join(article_data['authors'])[:300],  # ИЗ КЭША
-                    'Affiliations': safe_join(article_data['affiliations'])[:500],  # ИЗ КЭША
-                    'Countries': safe_join(article_data['countries'])[:100],  # ИЗ КЭША
-                    'Publication_Year': safe_convert(cr.get('published', {}).get('date-parts', [[0]])[0][0]),
-                    'Journal': safe_convert(journal_info['journal_name'])[:100],  # ИЗ КЭША
-                    'Publisher': safe_convert(journal_info['publisher'])[:100],  # ИЗ КЭША
-                    'ISSN': safe_join([str(issn) for issn in journal_info['issn'] if issn])[:50],  # ИЗ КЭША
+                    'DOI': safe_convert(cr.get('DOI', '')),
+                    'Title': truncate(cr.get('title', [''])[0] if cr.get('title') else 'No title', 200),
+                    'Authors_Crossref': safe_join([f"{a.get('given', '')} {a.get('family', '')}".strip() for a in cr.get('author', []) if a.get('given') or a.get('family')], max_len=300),
+                    'Authors_OpenAlex': safe_join(article_data['authors'], max_len=300),  # ИЗ КЭША
+                    'Affiliations': safe_join(article_data['affiliations'], max_len=500),  # ИЗ КЭША
+                    'Countries': safe_join(article_data['countries'], max_len=100),  # ИЗ КЭША
+                    'Publication_Year': safe_convert(get_publication_year(cr)),
+                    'Journal': truncate(safe_convert(journal_info['journal_name']), 100),  # ИЗ КЭША
+                    'Publisher': truncate(safe_convert(journal_info['publisher']), 100),  # ИЗ КЭША
+                    'ISSN': safe_join([str(issn) for issn in journal_info['issn'] if issn], max_len=50),  # ИЗ КЭША
                     'Reference_Count': safe_convert(cr.get('reference-count', 0) or (precomputed['oa'].get('referenced_works_count', 0) if precomputed['oa'] else 0)),
                     'Citations_Crossref': safe_convert(cr.get('is-referenced-by-count', 0)),
                     'Citations_OpenAlex': safe_convert(precomputed['oa'].get('cited_by_count', 0)) if precomputed['oa'] else 0,
                     'Author_Count': safe_convert(len(cr.get('author', []))),
-                    'Work_Type': safe_convert(cr.get('type', ''))[:50],
+                    'Work_Type': truncate(safe_convert(cr.get('type', '')), 50),
                     'Used for SC': '×' if usage_info.get('used_for_sc') else '',
                     'Used for IF': '×' if usage_info.get('used_for_if') else ''
                 })
@@ -5288,7 +5983,7 @@ def create_enhanced_excel_report(analyzed_data, citing_data, analyzed_stats, cit
                         
             if analyzed_list:
                 analyzed_df = pd.DataFrame(analyzed_list)
-                analyzed_df.to_excel(writer, sheet_name='Analyzed_Articles', index=False)
+                write_sheet(writer, 'Analyzed_Articles', analyzed_df)
 
             # Sheet 2: Citing works (with optimization) - UPDATED WITH 4 NEW COLUMNS
             citing_list = []
@@ -5319,21 +6014,21 @@ def create_enhanced_excel_report(analyzed_data, citing_data, analyzed_stats, cit
                         print(f"🔍 Citing_Works DEBUG - Item {i}: DOI={citing_doi}, usage_info={usage_info}")
                     
                     citing_list.append({
-                        'DOI': safe_convert(cr.get('DOI', ''))[:100],
-                        'Title': (cr.get('title', [''])[0] if cr.get('title') else 'No title')[:200],
-                        'Authors_Crossref': safe_join([f"{a.get('given', '')} {a.get('family', '')}".strip() for a in cr.get('author', []) if a.get('given') or a.get('family')])[:300],
-                        'Authors_OpenAlex': safe_join(authors_list)[:300],
-                        'Affiliations': safe_join(affiliations_list)[:500],
-                        'Countries': safe_join(countries_list)[:100],
-                        'Publication_Year': safe_convert(cr.get('published', {}).get('date-parts', [[0]])[0][0]),
-                        'Journal': safe_convert(journal_info['journal_name'])[:100],
-                        'Publisher': safe_convert(journal_info['publisher'])[:100],
-                        'ISSN': safe_join([str(issn) for issn in journal_info['issn'] if issn])[:50],
+                        'DOI': safe_convert(cr.get('DOI', '')),
+                        'Title': truncate(cr.get('title', [''])[0] if cr.get('title') else 'No title', 200),
+                        'Authors_Crossref': safe_join([f"{a.get('given', '')} {a.get('family', '')}".strip() for a in cr.get('author', []) if a.get('given') or a.get('family')], max_len=300),
+                        'Authors_OpenAlex': safe_join(authors_list, max_len=300),
+                        'Affiliations': safe_join(affiliations_list, max_len=500),
+                        'Countries': safe_join(countries_list, max_len=100),
+                        'Publication_Year': safe_convert(get_publication_year(cr)),
+                        'Journal': truncate(safe_convert(journal_info['journal_name']), 100),
+                        'Publisher': truncate(safe_convert(journal_info['publisher']), 100),
+                        'ISSN': safe_join([str(issn) for issn in journal_info['issn'] if issn], max_len=50),
                         'Reference_Count': safe_convert(cr.get('reference-count', 0) or (oa.get('referenced_works_count', 0) if oa else 0)),
                         'Citations_Crossref': safe_convert(cr.get('is-referenced-by-count', 0)),
                         'Citations_OpenAlex': safe_convert(oa.get('cited_by_count', 0)) if oa else 0,
                         'Author_Count': safe_convert(len(cr.get('author', []))),
-                        'Work_Type': safe_convert(cr.get('type', ''))[:50],
+                        'Work_Type': truncate(safe_convert(cr.get('type', '')), 50),
                         # FIXED: 4 columns for special analysis usage - using proper dictionary access
                         'Used for SC': '×' if usage_info.get('used_for_sc') else '',
                         'Used for SC_corr': '×' if usage_info.get('used_for_sc_corr') else '',
@@ -5343,23 +6038,24 @@ def create_enhanced_excel_report(analyzed_data, citing_data, analyzed_stats, cit
             
             if citing_list:
                 citing_df = pd.DataFrame(citing_list)
-                citing_df.to_excel(writer, sheet_name='Citing_Works', index=False)
+                write_sheet(writer, 'Citing_Works', citing_df)
 
             # Sheet 3: Overlaps between analyzed and citing works
-            overlap_list = []
-            for overlap in overlap_details:
-                overlap_list.append({
-                    'Analyzed_DOI': safe_convert(overlap['analyzed_doi'])[:100],
-                    'Citing_DOI': safe_convert(overlap['citing_doi'])[:100],
-                    'Common_Authors': safe_join(overlap['common_authors'])[:300],
-                    'Common_Authors_Count': safe_convert(overlap['common_authors_count']),
-                    'Common_Affiliations': safe_join(overlap['common_affiliations'])[:500],
-                    'Common_Affiliations_Count': safe_convert(overlap['common_affiliations_count'])
-                })
-            
-            if overlap_list:
-                overlap_df = pd.DataFrame(overlap_list)
-                overlap_df.to_excel(writer, sheet_name='Work_Overlaps', index=False)
+            if overlap_details:
+                write_rows(writer, 'Work_Overlaps', (
+                    'Analyzed_DOI', 'Citing_DOI', 'Common_Authors', 'Common_Authors_Count',
+                    'Common_Affiliations', 'Common_Affiliations_Count'
+                ), (
+                    (
+                        safe_convert(overlap['analyzed_doi'])[:100],
+                        safe_convert(overlap['citing_doi'])[:100],
+                        safe_join(overlap['common_authors'], max_len=300),
+                        safe_convert(overlap['common_authors_count']),
+                        safe_join(overlap['common_affiliations'], max_len=500),
+                        safe_convert(overlap['common_affiliations_count'])
+                    )
+                    for overlap in overlap_details
+                ))
 
             # Sheet 4: Time to first citation (WITH EDITORIAL NOTES EXCLUDED)
             first_citation_list = []
@@ -5386,7 +6082,7 @@ def create_enhanced_excel_report(analyzed_data, citing_data, analyzed_stats, cit
             
             if first_citation_list:
                 first_citation_df = pd.DataFrame(first_citation_list)
-                first_citation_df.to_excel(writer, sheet_name='First_Citations', index=False)
+                write_sheet(writer, 'First_Citations', first_citation_df)
 
             # Sheet 5: Combined Statistics (NEW - объединенный лист)
             statistics_data = {
@@ -5478,8 +6174,7 @@ def create_enhanced_excel_report(analyzed_data, citing_data, analyzed_stats, cit
                     'N/A'   # Articles with ≥50 citations
                 ]
             }
-            statistics_df = pd.DataFrame(statistics_data)
-            statistics_df.to_excel(writer, sheet_name='Statistics', index=False)
+            write_columns(writer, 'Statistics', statistics_data)
 
             # Sheet 6: Combined Citing Stats (NEW - объединенный лист Enhanced_Statistics и Citation_Timing)
             citing_stats_data = {
@@ -5511,37 +6206,18 @@ def create_enhanced_excel_report(analyzed_data, citing_data, analyzed_stats, cit
                     safe_convert(citation_timing['total_years_covered'])
                 ]
             }
-            citing_stats_df = pd.DataFrame(citing_stats_data)
-            citing_stats_df.to_excel(writer, sheet_name='Citing_Stats', index=False)
+            write_columns(writer, 'Citing_Stats', citing_stats_data)
 
             # Sheet 7: Citations by year
-            yearly_citations_data = []
-            for yearly_stat in citation_timing['yearly_citations']:
-                yearly_citations_data.append({
-                    'Year': safe_convert(yearly_stat['year']),
-                    'Citations_Count': safe_convert(yearly_stat['citations_count'])
-                })
-            
-            if yearly_citations_data:
-                yearly_citations_df = pd.DataFrame(yearly_citations_data)
-                yearly_citations_df.to_excel(writer, sheet_name='Citations_by_Year', index=False)
+            yearly_array = citation_timing['yearly_array']
+            if len(yearly_array):
+                write_rows(writer, 'Citations_by_Year', ('Year', 'Citations_Count'), zip(yearly_array[:, 0].tolist(), yearly_array[:, 1].tolist()))
 
             # Sheet 8: Citation network (СОРТИРОВКА ПО ГОДАМ)
-            citation_network_data = []
-            for year, citing_years in enhanced_stats.get('citation_network', {}).items():
-                year_counts = Counter(citing_years)
-                for citing_year, count in year_counts.items():
-                    citation_network_data.append({
-                        'Publication_Year': safe_convert(year),
-                        'Citation_Year': safe_convert(citing_year),
-                        'Citations_Count': safe_convert(count)
-                    })
-            
             # === СОРТИРОВКА: сначала по году публикации, затем по году цитирования ===
-            if citation_network_data:
-                citation_network_df = pd.DataFrame(citation_network_data)
-                citation_network_df = citation_network_df.sort_values(['Publication_Year', 'Citation_Year'])
-                citation_network_df.to_excel(writer, sheet_name='Citation_Network', index=False)
+            citation_network_rows = count_year_pairs(enhanced_stats.get('citation_network', {}))
+            if citation_network_rows:
+                write_rows(writer, 'Citation_Network', ('Publication_Year', 'Citation_Year', 'Citations_Count'), citation_network_rows)
 
             # === NEW COMBINED SHEETS ===
 
@@ -5554,7 +6230,7 @@ def create_enhanced_excel_report(analyzed_data, citing_data, analyzed_stats, cit
             )
             if combined_authors_data:
                 combined_authors_df = pd.DataFrame(combined_authors_data)
-                combined_authors_df.to_excel(writer, sheet_name='Combined_Authors', index=False)
+                write_sheet(writer, 'Combined_Authors', combined_authors_df)
 
             # Sheet 10: Combined Affiliations (REPLACES All_Affiliations_Analyzed and All_Affiliations_Citing)
             combined_affiliations_data = create_combined_affiliations_sheet(
@@ -5566,7 +6242,7 @@ def create_enhanced_excel_report(analyzed_data, citing_data, analyzed_stats, cit
             )
             if combined_affiliations_data:
                 combined_affiliations_df = pd.DataFrame(combined_affiliations_data)
-                combined_affiliations_df.to_excel(writer, sheet_name='Combined_Affiliations', index=False)
+                write_sheet(writer, 'Combined_Affiliations', combined_affiliations_df)
 
             # Sheet 11: Combined Countries (REPLACES All_Countries_Analyzed and All_Countries_Citing)
             combined_countries_data = create_combined_countries_sheet(
@@ -5577,7 +6253,7 @@ def create_enhanced_excel_report(analyzed_data, citing_data, analyzed_stats, cit
             )
             if combined_countries_data:
                 combined_countries_df = pd.DataFrame(combined_countries_data)
-                combined_countries_df.to_excel(writer, sheet_name='Combined_Countries', index=False)
+                write_sheet(writer, 'Combined_Countries', combined_countries_df)
 
             # Sheet 12: All journals citing (with percentages) - UPDATED VERSION WITH CS DATA
             if citing_stats['all_journals']:
@@ -5632,77 +6308,58 @@ def create_enhanced_excel_report(analyzed_data, citing_data, analyzed_stats, cit
                     })
                 
                 all_citing_journals_df = pd.DataFrame(all_citing_journals_data)
-                all_citing_journals_df.to_excel(writer, sheet_name='All_Journals_Citing', index=False)
+                write_sheet(writer, 'All_Journals_Citing', all_citing_journals_df)
 
             # Sheet 13: All publishers citing (with percentages)
             if citing_stats['all_publishers']:
-                all_citing_publishers_data = []
                 total_articles = safe_convert(citing_stats['n_items'])
-                for publisher, count in citing_stats['all_publishers']:
-                    percentage = (safe_convert(count) / total_articles * 100) if total_articles > 0 else 0
-                    all_citing_publishers_data.append({
-                        'Publisher': safe_convert(publisher),
-                        'Articles_Count': safe_convert(count),
-                        'Percentage': round(percentage, 2)
-                    })
-                all_citing_publishers_df = pd.DataFrame(all_citing_publishers_data)
-                all_citing_publishers_df.to_excel(writer, sheet_name='All_Publishers_Citing', index=False)
+                write_rows(writer, 'All_Publishers_Citing', ('Publisher', 'Articles_Count', 'Percentage'), (
+                    (
+                        safe_convert(publisher),
+                        safe_convert(count),
+                        round((safe_convert(count) / total_articles * 100) if total_articles > 0 else 0, 2)
+                    )
+                    for publisher, count in citing_stats['all_publishers']
+                ))
 
             # Sheet 14: Fast metrics (NEW)
-            fast_metrics_data = {
-                'Metric': [
-                    'Reference Age (median)', 'Reference Age (mean)',
-                    'Reference Age (25-75 percentile)', 'References Analyzed',
-                    'Journal Self-Citation Rate (JSCR)', 'Journal Self-Citations',
-                    'Total Citations for JSCR',
-                    'Cited Half-Life (median)', 'Cited Half-Life (mean)',
-                    'Articles with CHL Data',
-                    'Field-Weighted Citation Impact (FWCI)', 'Total Citations',
-                    'Expected Citations',
-                    'Citation Velocity', 'Articles with Velocity Data',
-                    'OA Impact Premium', 'OA Articles', 'Non-OA Articles',
-                    'Average OA Citations', 'Average Non-OA Citations',
-                    'Elite Index', 'Elite Articles', 'Citation Threshold',
-                    'Author Gini Index', 'Total Authors',
-                    'Average Articles per Author', 'Median Articles per Author',
-                    'Diversity Balance Index (DBI)', 'Unique Concepts',
-                    'Total Concept Mentions'
-                ],
-                'Value': [
-                    safe_convert(fast_metrics.get('ref_median_age', 'N/A')),
-                    safe_convert(fast_metrics.get('ref_mean_age', 'N/A')),
-                    f"{safe_convert(fast_metrics.get('ref_ages_25_75', ['N/A', 'N/A'])[0])}-{safe_convert(fast_metrics.get('ref_ages_25_75', ['N/A', 'N/A'])[1])}",
-                    safe_convert(fast_metrics.get('total_refs_analyzed', 0)),
-                    f"{safe_convert(fast_metrics.get('JSCR', 0))}%",
-                    safe_convert(fast_metrics.get('self_cites', 0)),
-                    safe_convert(fast_metrics.get('total_cites', 0)),
-                    safe_convert(fast_metrics.get('cited_half_life_median', 'N/A')),
-                    safe_convert(fast_metrics.get('cited_half_life_mean', 'N/A')),
-                    safe_convert(fast_metrics.get('articles_with_chl', 0)),
-                    safe_convert(fast_metrics.get('FWCI', 0)),
-                    safe_convert(fast_metrics.get('total_cites', 0)),
-                    safe_convert(fast_metrics.get('expected_cites', 0)),
-                    safe_convert(fast_metrics.get('citation_velocity', 0)),
-                    safe_convert(fast_metrics.get('articles_with_velocity', 0)),
-                    f"{safe_convert(fast_metrics.get('OA_impact_premium', 0))}%",
-                    safe_convert(fast_metrics.get('OA_articles', 0)),
-                    safe_convert(fast_metrics.get('non_OA_articles', 0)),
-                    safe_convert(fast_metrics.get('OA_avg_citations', 0)),
-                    safe_convert(fast_metrics.get('non_OA_avg_citations', 0)),
-                    f"{safe_convert(fast_metrics.get('elite_index', 0))}%",
-                    safe_convert(fast_metrics.get('elite_articles', 0)),
-                    safe_convert(fast_metrics.get('citation_threshold', 0)),
-                    safe_convert(fast_metrics.get('author_gini', 0)),
-                    safe_convert(fast_metrics.get('total_authors', 0)),
-                    safe_convert(fast_metrics.get('articles_per_author_avg', 0)),
-                    safe_convert(fast_metrics.get('articles_per_author_median', 0)),
-                    safe_convert(fast_metrics.get('DBI', 0)),
-                    safe_convert(fast_metrics.get('unique_concepts', 0)),
-                    safe_convert(fast_metrics.get('total_concept_mentions', 0))
-                ]
-            }
-            fast_metrics_df = pd.DataFrame(fast_metrics_data)
-            fast_metrics_df.to_excel(writer, sheet_name='Fast_Metrics', index=False)
+            get_metric = fast_metrics.get
+            ref_ages_25_75 = get_metric('ref_ages_25_75', ['N/A', 'N/A'])
+            ref_age_range = f"{safe_convert(ref_ages_25_75[0])}-{safe_convert(ref_ages_25_75[1])}"
+            total_cites = safe_convert(get_metric('total_cites', 0))
+            fast_metrics_rows = [
+                ('Reference Age (median)', safe_convert(get_metric('ref_median_age', 'N/A'))),
+                ('Reference Age (mean)', safe_convert(get_metric('ref_mean_age', 'N/A'))),
+                ('Reference Age (25-75 percentile)', ref_age_range),
+                ('References Analyzed', safe_convert(get_metric('total_refs_analyzed', 0))),
+                ('Journal Self-Citation Rate (JSCR)', f"{safe_convert(get_metric('JSCR', 0))}%"),
+                ('Journal Self-Citations', safe_convert(get_metric('self_cites', 0))),
+                ('Total Citations for JSCR', total_cites),
+                ('Cited Half-Life (median)', safe_convert(get_metric('cited_half_life_median', 'N/A'))),
+                ('Cited Half-Life (mean)', safe_convert(get_metric('cited_half_life_mean', 'N/A'))),
+                ('Articles with CHL Data', safe_convert(get_metric('articles_with_chl', 0))),
+                ('Field-Weighted Citation Impact (FWCI)', safe_convert(get_metric('FWCI', 0))),
+                ('Total Citations', total_cites),
+                ('Expected Citations', safe_convert(get_metric('expected_cites', 0))),
+                ('Citation Velocity', safe_convert(get_metric('citation_velocity', 0))),
+                ('Articles with Velocity Data', safe_convert(get_metric('articles_with_velocity', 0))),
+                ('OA Impact Premium', f"{safe_convert(get_metric('OA_impact_premium', 0))}%"),
+                ('OA Articles', safe_convert(get_metric('OA_articles', 0))),
+                ('Non-OA Articles', safe_convert(get_metric('non_OA_articles', 0))),
+                ('Average OA Citations', safe_convert(get_metric('OA_avg_citations', 0))),
+                ('Average Non-OA Citations', safe_convert(get_metric('non_OA_avg_citations', 0))),
+                ('Elite Index', f"{safe_convert(get_metric('elite_index', 0))}%"),
+                ('Elite Articles', safe_convert(get_metric('elite_articles', 0))),
+                ('Citation Threshold', safe_convert(get_metric('citation_threshold', 0))),
+                ('Author Gini Index', safe_convert(get_metric('author_gini', 0))),
+                ('Total Authors', safe_convert(get_metric('total_authors', 0))),
+                ('Average Articles per Author', safe_convert(get_metric('articles_per_author_avg', 0))),
+                ('Median Articles per Author', safe_convert(get_metric('articles_per_author_median', 0))),
+                ('Diversity Balance Index (DBI)', safe_convert(get_metric('DBI', 0))),
+                ('Unique Concepts', safe_convert(get_metric('unique_concepts', 0))),
+                ('Total Concept Mentions', safe_convert(get_metric('total_concept_mentions', 0)))
+            ]
+            write_rows(writer, 'Fast_Metrics', ('Metric', 'Value'), fast_metrics_rows)
 
             # Sheet 15: Terms and Topics Analysis
             if 'terms_topics_stats' in additional_data and additional_data['terms_topics_stats']:
@@ -5732,7 +6389,7 @@ def create_enhanced_excel_report(analyzed_data, citing_data, analyzed_stats, cit
                 terms_topics_data = terms_topics_data[:100]
                 
                 terms_topics_df = pd.DataFrame(terms_topics_data)
-                terms_topics_df.to_excel(writer, sheet_name='Terms_and_Topics', index=False)
+                write_sheet(writer, 'Terms_and_Topics', terms_topics_df)
 
             # === НОВЫЙ ЛИСТ: Объединенный анализ ключевых слов в названиях ===
             # Sheet 16: Combined Title Keywords (NEW) - ИСПРАВЛЕНО: правильное имя листа
@@ -5742,43 +6399,36 @@ def create_enhanced_excel_report(analyzed_data, citing_data, analyzed_stats, cit
                 
                 if normalized_keywords:
                     keywords_df = pd.DataFrame(normalized_keywords)
-                    keywords_df.to_excel(writer, sheet_name='Combined_Title_Keywords', index=False)
+                    write_sheet(writer, 'Combined_Title_Keywords', keywords_df)
 
             # Sheet 17: Citation seasonality - ИСПРАВЛЕНО: правильное имя листа
             if 'citation_seasonality' in additional_data:
-                seasonality_data = []
                 citation_seasonality = additional_data['citation_seasonality']
                 
                 # Citation by month chart
-                for month in range(1, 13):
-                    month_name = datetime(2023, month, 1).strftime('%B')
-                    citation_count = safe_convert(citation_seasonality['citation_months'].get(month, 0))
-                    publication_count = safe_convert(citation_seasonality['publication_months'].get(month, 0))
-                    
-                    seasonality_data.append({
-                        'Month_Number': safe_convert(month),
-                        'Month_Name': safe_convert(month_name),
-                        'Citation_Count': citation_count,
-                        'Publication_Count': publication_count
-                    })
-                
-                if seasonality_data:
-                    seasonality_df = pd.DataFrame(seasonality_data)
-                    seasonality_df.to_excel(writer, sheet_name='Citation_Seasonality', index=False)
+                write_rows(writer, 'Citation_Seasonality', ('Month_Number', 'Month_Name', 'Citation_Count', 'Publication_Count'), (
+                    (
+                        month,
+                        datetime(2023, month, 1).strftime('%B'),
+                        safe_convert(citation_seasonality['citation_months'].get(month, 0)),
+                        safe_convert(citation_seasonality['publication_months'].get(month, 0))
+                    )
+                    for month in range(1, 13)
+                ))
             
                 # Optimal publication months - ИСПРАВЛЕНО: создаем отдельный лист
                 if citation_seasonality['optimal_publication_months']:
-                    optimal_months_data = []
-                    for optimal in citation_seasonality['optimal_publication_months']:
-                        optimal_months_data.append({
-                            'High_Citation_Month': datetime(2023, safe_convert(optimal['citation_month']), 1).strftime('%B'),
-                            'Citation_Count': safe_convert(optimal['citation_count']),
-                            'Recommended_Publication_Month': datetime(2023, safe_convert(optimal['recommended_publication_month']), 1).strftime('%B'),
-                            'Reasoning': safe_convert(optimal['reasoning'])
-                        })
-                    
-                    optimal_months_df = pd.DataFrame(optimal_months_data)
-                    optimal_months_df.to_excel(writer, sheet_name='Optimal_Publication_Months', index=False)
+                    write_rows(writer, 'Optimal_Publication_Months', (
+                        'High_Citation_Month', 'Citation_Count', 'Recommended_Publication_Month', 'Reasoning'
+                    ), (
+                        (
+                            datetime(2023, safe_convert(optimal['citation_month']), 1).strftime('%B'),
+                            safe_convert(optimal['citation_count']),
+                            datetime(2023, safe_convert(optimal['recommended_publication_month']), 1).strftime('%B'),
+                            safe_convert(optimal['reasoning'])
+                        )
+                        for optimal in citation_seasonality['optimal_publication_months']
+                    ))
               
             # Sheet 18: Potential reviewers - ИСПРАВЛЕНО: правильное имя листа
             if 'potential_reviewers' in additional_data:
@@ -5788,15 +6438,14 @@ def create_enhanced_excel_report(analyzed_data, citing_data, analyzed_stats, cit
                 for reviewer in potential_reviewers_info['potential_reviewers']:
                     # Create separate rows for each DOI
                     for i, doi in enumerate(reviewer['citing_dois']):
-                        reviewers_data.append({
-                            'Author': safe_convert(reviewer['author']) if i == 0 else '',  # Only show author name in first row
-                            'Citation_Count': safe_convert(reviewer['citation_count']) if i == 0 else '',
-                            'Citing_DOI': safe_convert(doi)
-                        })
+                        reviewers_data.append((
+                            safe_convert(reviewer['author']) if i == 0 else '',  # Only show author name in first row
+                            safe_convert(reviewer['citation_count']) if i == 0 else '',
+                            safe_convert(doi)
+                        ))
                 
                 if reviewers_data:
-                    reviewers_df = pd.DataFrame(reviewers_data)
-                    reviewers_df.to_excel(writer, sheet_name='Potential_Reviewers', index=False)
+                    write_rows(writer, 'Potential_Reviewers', ('Author', 'Citation_Count', 'Citing_DOI'), reviewers_data)
 
             # Sheet 19: Special Analysis Metrics (NEW) - ИСПРАВЛЕНО: правильное имя листа
             if 'special_analysis_metrics' in additional_data:
@@ -5829,8 +6478,7 @@ def create_enhanced_excel_report(analyzed_data, citing_data, analyzed_stats, cit
                         safe_convert(debug_info.get('F', 0))
                     ]
                 }
-                special_metrics_df = pd.DataFrame(special_metrics_data)
-                special_metrics_df.to_excel(writer, sheet_name='Special_Analysis_Metrics', index=False)
+                write_columns(writer, 'Special_Analysis_Metrics', special_metrics_data)
 
             # === NEW SHEET: Author ID Data ===
             # Sheet 20: Author_ID_data (NEW)
@@ -5838,7 +6486,7 @@ def create_enhanced_excel_report(analyzed_data, citing_data, analyzed_stats, cit
                 author_id_data = create_author_id_sheet(analyzed_data, citing_data, state)
                 if author_id_data:
                     author_id_df = pd.DataFrame(author_id_data)
-                    author_id_df.to_excel(writer, sheet_name='Author_ID_data', index=False)
+                    write_sheet(writer, 'Author_ID_data', author_id_df)
 
             # Ensure at least one sheet exists
             if len(writer.sheets) == 0:
@@ -5846,7 +6494,7 @@ def create_enhanced_excel_report(analyzed_data, citing_data, analyzed_stats, cit
                     'Status': ['Analysis completed'],
                     'Message': ['No data matched the criteria. Check ISSN and period.']
                 })
-                summary_df.to_excel(writer, sheet_name='Summary', index=False)
+                write_sheet(writer, 'Summary', summary_df)
 
         excel_buffer.seek(0)
         return True
@@ -5858,16 +6506,17 @@ def create_enhanced_excel_report(analyzed_data, citing_data, analyzed_stats, cit
             excel_buffer.seek(0)
             excel_buffer.truncate(0)
             
-            with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
+            with open_excel_writer(excel_buffer) as writer:
                 error_df = pd.DataFrame({
                     'Error': [f'{translation_manager.get_text("failed_create_full_report")}: {str(e)}'],
                     'Recommendation': [translation_manager.get_text('try_reduce_data_or_period')]
                 })
-                error_df.to_excel(writer, sheet_name='Information', index=False)
+                write_sheet(writer, 'Information', error_df)
             
             excel_buffer.seek(0)
             st.warning(translation_manager.get_text('simplified_report_created'))
-            return True
+            # A file exists, but it is not the full report (the caller must not cache it)
+            return False
             
         except Exception as e2:
             st.error(translation_manager.get_text('critical_excel_error').format(error=str(e2)))
@@ -5935,19 +6584,70 @@ def precompute_excel_data(analyzed_data, citing_data, analyzed_stats, citing_sta
     }
 
 # === 18. Data Visualization ===
+# Figure builders take hashable inputs (tuples, strings) so reruns reuse cached figures
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_yearly_citations_figure(years, citations, series_name, title, xaxis_title, yaxis_title):
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=list(years), 
+        y=list(citations), 
+        name=series_name,
+        marker_color='lightblue'
+    ))
+    fig.update_layout(
+        title=title,
+        xaxis_title=xaxis_title,
+        yaxis_title=yaxis_title,
+        showlegend=False
+    )
+    return fig
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_horizontal_bar_figure(names, values, names_label, values_label, title, color_by_value=False):
+    return px.bar(
+        x=list(values), 
+        y=list(names), 
+        orientation='h',
+        labels={'x': values_label, 'y': names_label, 'color': values_label},
+        title=title,
+        color=list(values) if color_by_value else None
+    )
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_category_bar_figure(categories, values, categories_label, values_label, title):
+    return px.bar(
+        x=list(categories), 
+        y=list(values),
+        labels={'x': categories_label, 'y': values_label, 'color': categories_label},
+        title=title,
+        color=list(categories)
+    )
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_pie_figure(names, values, names_label, values_label, title):
+    return px.pie(
+        values=list(values), 
+        names=list(names),
+        labels={'values': values_label, 'names': names_label},
+        title=title
+    )
+
 def create_visualizations(analyzed_stats, citing_stats, enhanced_stats, citation_timing, overlap_details, fast_metrics, additional_data, is_special_analysis=False):
     """Create visualizations for dashboard"""
+    # Bound once: called for nearly every widget label
+    get_text = translation_manager.get_text
     
     # Create tabs for different visualization types
     tab1, tab2, tab3, tab4 = st.tabs([
-        translation_manager.get_text('tab_main_metrics'), 
-        translation_manager.get_text('tab_authors_organizations'), 
-        translation_manager.get_text('tab_geography'), 
-        translation_manager.get_text('tab_citations')
+        get_text('tab_main_metrics'), 
+        get_text('tab_authors_organizations'), 
+        get_text('tab_geography'), 
+        get_text('tab_citations')
     ])
     
     with tab1:
-        st.subheader(translation_manager.get_text('tab_main_metrics'))
+        st.subheader(get_text('tab_main_metrics'))
         
         # Check if we're in Special Analysis mode and show additional metrics
         if is_special_analysis and 'special_analysis_metrics' in additional_data:
@@ -6004,58 +6704,58 @@ def create_visualizations(analyzed_stats, citing_stats, enhanced_stats, citation
         
         with col1:
             st.metric(
-                translation_manager.get_text('h_index'), 
+                get_text('h_index'), 
                 enhanced_stats['h_index'],
                 help=glossary.get_tooltip('H-index')
             )
         with col2:
             st.metric(
-                translation_manager.get_text('total_articles'), 
+                get_text('total_articles'), 
                 analyzed_stats['n_items'],
                 help=glossary.get_tooltip('Crossref')
             )
         with col3:
             st.metric(
-                translation_manager.get_text('total_citations'), 
+                get_text('total_citations'), 
                 enhanced_stats['total_citations'],
-                help=translation_manager.get_text('total_citations_tooltip')
+                help=get_text('total_citations_tooltip')
             )
         with col4:
             st.metric(
-                translation_manager.get_text('average_citations'), 
+                get_text('average_citations'), 
                 f"{enhanced_stats['avg_citations_per_article']:.1f}",
-                help=translation_manager.get_text('average_citations_tooltip')
+                help=get_text('average_citations_tooltip')
             )
         
         col5, col6, col7, col8 = st.columns(4)
         
         with col5:
             st.metric(
-                translation_manager.get_text('articles_with_citations'), 
+                get_text('articles_with_citations'), 
                 enhanced_stats['articles_with_citations'],
-                help=translation_manager.get_text('articles_with_citations_tooltip')
+                help=get_text('articles_with_citations_tooltip')
             )
         with col6:
             st.metric(
-                translation_manager.get_text('self_citations'), 
+                get_text('self_citations'), 
                 f"{analyzed_stats['self_cites_pct']:.1f}%",
                 help=glossary.get_tooltip('Self-Cites')
             )
         with col7:
             st.metric(
-                translation_manager.get_text('international_articles'), 
+                get_text('international_articles'), 
                 f"{analyzed_stats['multi_country_pct']:.1f}%",
                 help=glossary.get_tooltip('International Collaboration')
             )
         with col8:
             st.metric(
-                translation_manager.get_text('unique_affiliations'), 
+                get_text('unique_affiliations'), 
                 analyzed_stats['unique_affiliations_count'],
-                help=translation_manager.get_text('unique_affiliations_tooltip')
+                help=get_text('unique_affiliations_tooltip')
             )
         
         # Contextual tooltip for H-index
-        with st.expander("❓ " + translation_manager.get_text('what_is_h_index'), expanded=False):
+        with st.expander("❓ " + get_text('what_is_h_index'), expanded=False):
             h_info = glossary.get_detailed_info('H-index')
             if h_info:
                 st.write(f"**{h_info['term']}** - {h_info['definition']}")
@@ -6065,27 +6765,20 @@ def create_visualizations(analyzed_stats, citing_stats, enhanced_stats, citation
                 st.write(f"**Category:** {h_info['category']}")
         
         # Citations by year chart
-        if citation_timing['yearly_citations']:
-            years = [item['year'] for item in citation_timing['yearly_citations']]
-            citations = [item['citations_count'] for item in citation_timing['yearly_citations']]
-            
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                x=years, 
-                y=citations, 
-                name=translation_manager.get_text('citations'),
-                marker_color='lightblue'
-            ))
-            fig.update_layout(
-                title=translation_manager.get_text('citations_by_year'),
-                xaxis_title=translation_manager.get_text('year'),
-                yaxis_title=translation_manager.get_text('citations_count'),
-                showlegend=False
+        yearly_array = citation_timing['yearly_array']
+        if len(yearly_array):
+            fig = build_yearly_citations_figure(
+                tuple(yearly_array[:, 0].tolist()), 
+                tuple(yearly_array[:, 1].tolist()), 
+                get_text('citations'),
+                get_text('citations_by_year'),
+                get_text('year'),
+                get_text('citations_count')
             )
             st.plotly_chart(fig, use_container_width=True)
     
     with tab2:
-        st.subheader(translation_manager.get_text('tab_authors_organizations'))
+        st.subheader(get_text('tab_authors_organizations'))
         
         col1, col2 = st.columns(2)
         
@@ -6093,168 +6786,230 @@ def create_visualizations(analyzed_stats, citing_stats, enhanced_stats, citation
             # Top authors of analyzed articles
             if analyzed_stats['all_authors']:
                 top_authors = analyzed_stats['all_authors'][:15]
-                authors_df = pd.DataFrame(top_authors, columns=[translation_manager.get_text('author'), translation_manager.get_text('articles')])
-                fig = px.bar(
-                    authors_df, 
-                    x=translation_manager.get_text('articles'), 
-                    y=translation_manager.get_text('author'), 
-                    orientation='h',
-                    title=translation_manager.get_text('top_15_authors_analyzed')
+                fig = build_horizontal_bar_figure(
+                    tuple(author for author, _ in top_authors), 
+                    tuple(count for _, count in top_authors), 
+                    get_text('author'),
+                    get_text('articles'),
+                    get_text('top_15_authors_analyzed')
                 )
                 st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             # Author count distribution
-            author_counts_data = {
-                translation_manager.get_text('category'): ['1 ' + translation_manager.get_text('author'), '2-5 ' + translation_manager.get_text('authors'), '6-10 ' + translation_manager.get_text('authors'), '>10 ' + translation_manager.get_text('authors')],
-                translation_manager.get_text('articles'): [
+            fig = build_pie_figure(
+                ('1 ' + get_text('author'), '2-5 ' + get_text('authors'), '6-10 ' + get_text('authors'), '>10 ' + get_text('authors')),
+                (
                     analyzed_stats['single_authors'],
                     analyzed_stats['n_items'] - analyzed_stats['single_authors'] - analyzed_stats['multi_authors_gt10'],
                     analyzed_stats['multi_authors_gt10'],
                     0  # Can add additional categorization
-                ]
-            }
-            fig = px.pie(
-                author_counts_data, 
-                values=translation_manager.get_text('articles'), 
-                names=translation_manager.get_text('category'),
-                title=translation_manager.get_text('author_count_distribution')
+                ),
+                get_text('category'),
+                get_text('articles'),
+                get_text('author_count_distribution')
             )
             st.plotly_chart(fig, use_container_width=True)
         
         # Contextual tooltip for Author Gini
         if fast_metrics.get('author_gini', 0) > 0:
-            with st.expander("🎯 " + translation_manager.get_text('author_gini_meaning'), expanded=False):
+            with st.expander("🎯 " + get_text('author_gini_meaning'), expanded=False):
                 gini_info = glossary.get_detailed_info('Author Gini')
                 if gini_info:
-                    st.write(f"**{translation_manager.get_text('current_value')}:** {fast_metrics['author_gini']}")
-                    st.write(f"**{translation_manager.get_text('interpretation')}:** {gini_info['interpretation']}")
+                    st.write(f"**{get_text('current_value')}:** {fast_metrics['author_gini']}")
+                    st.write(f"**{get_text('interpretation')}:** {gini_info['interpretation']}")
                     st.progress(min(fast_metrics['author_gini'], 1.0))
         
         # Top affiliations
         if analyzed_stats['all_affiliations']:
             top_affiliations = analyzed_stats['all_affiliations'][:10]
-            aff_df = pd.DataFrame(top_affiliations, columns=[translation_manager.get_text('affiliation'), translation_manager.get_text('mentions')])
-            fig = px.bar(
-                aff_df, 
-                x=translation_manager.get_text('mentions'), 
-                y=translation_manager.get_text('affiliation'), 
-                orientation='h',
-                title=translation_manager.get_text('top_10_affiliations_analyzed'),
-                color=translation_manager.get_text('mentions')
+            fig = build_horizontal_bar_figure(
+                tuple(affiliation for affiliation, _ in top_affiliations), 
+                tuple(count for _, count in top_affiliations), 
+                get_text('affiliation'),
+                get_text('mentions'),
+                get_text('top_10_affiliations_analyzed'),
+                color_by_value=True
             )
             st.plotly_chart(fig, use_container_width=True)
     
     with tab3:
-        st.subheader(translation_manager.get_text('tab_geography'))
+        st.subheader(get_text('tab_geography'))
         
         col1, col2 = st.columns(2)
         
         with col1:
             # Country distribution
             if analyzed_stats['all_countries']:
-                countries_df = pd.DataFrame(analyzed_stats['all_countries'], columns=[translation_manager.get_text('country'), translation_manager.get_text('articles')])
-                fig = px.pie(
-                    countries_df, 
-                    values=translation_manager.get_text('articles'), 
-                    names=translation_manager.get_text('country'),
-                    title=translation_manager.get_text('article_country_distribution')
+                fig = build_pie_figure(
+                    tuple(country for country, _ in analyzed_stats['all_countries']),
+                    tuple(count for _, count in analyzed_stats['all_countries']), 
+                    get_text('country'),
+                    get_text('articles'),
+                    get_text('article_country_distribution')
                 )
                 st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             # International collaboration
-            collaboration_data = {
-                translation_manager.get_text('type'): [translation_manager.get_text('single_country'), translation_manager.get_text('multiple_countries'), translation_manager.get_text('no_data')],
-                translation_manager.get_text('articles'): [
+            fig = build_category_bar_figure(
+                (get_text('single_country'), get_text('multiple_countries'), get_text('no_data')),
+                (
                     analyzed_stats['single_country_articles'],
                     analyzed_stats['multi_country_articles'],
                     analyzed_stats['no_country_articles']
-                ]
-            }
-            fig = px.bar(
-                collaboration_data, 
-                x=translation_manager.get_text('type'), 
-                y=translation_manager.get_text('articles'),
-                title=translation_manager.get_text('international_collaboration'),
-                color=translation_manager.get_text('type')
+                ),
+                get_text('type'),
+                get_text('articles'),
+                get_text('international_collaboration')
             )
             st.plotly_chart(fig, use_container_width=True)
         
         # Contextual tooltip for international collaboration
-        with st.expander("🌐 " + translation_manager.get_text('about_international_collaboration'), expanded=False):
+        with st.expander("🌐 " + get_text('about_international_collaboration'), expanded=False):
             collab_info = glossary.get_detailed_info('International Collaboration')
             if collab_info:
-                st.write(f"**{translation_manager.get_text('definition')}:** {collab_info['definition']}")
-                st.write(f"**{translation_manager.get_text('significance_for_science')}:** " + translation_manager.get_text('high_international_articles_indicator'))
+                st.write(f"**{get_text('definition')}:** {collab_info['definition']}")
+                st.write(f"**{get_text('significance_for_science')}:** " + get_text('high_international_articles_indicator'))
     
     with tab4:
-        st.subheader(translation_manager.get_text('tab_citations'))
+        st.subheader(get_text('tab_citations'))
         
         col1, col2 = st.columns(2)
         
         with col1:
             # Citations by thresholds
-            citation_thresholds = {
-                translation_manager.get_text('threshold'): ['≥10', '≥20', '≥30', '≥50'],
-                translation_manager.get_text('articles'): [
+            fig = build_category_bar_figure(
+                ('≥10', '≥20', '≥30', '≥50'),
+                (
                     analyzed_stats['articles_with_10_citations'],
                     analyzed_stats['articles_with_20_citations'],
                     analyzed_stats['articles_with_30_citations'],
                     analyzed_stats['articles_with_50_citations']
-                ]
-            }
-            fig = px.bar(
-                citation_thresholds, 
-                x=translation_manager.get_text('threshold'), 
-                y=translation_manager.get_text('articles'),
-                title=translation_manager.get_text('articles_by_citation_thresholds'),
-                color=translation_manager.get_text('threshold')
+                ),
+                get_text('threshold'),
+                get_text('articles'),
+                get_text('articles_by_citation_thresholds')
             )
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             # Articles with/without citations
-            citation_status = {
-                translation_manager.get_text('status'): [translation_manager.get_text('with_citations'), translation_manager.get_text('without_citations')],
-                translation_manager.get_text('count'): [
+            fig = build_pie_figure(
+                (get_text('with_citations'), get_text('without_citations')),
+                (
                     enhanced_stats['articles_with_citations'],
                     enhanced_stats['articles_without_citations']
-                ]
-            }
-            fig = px.pie(
-                citation_status, 
-                values=translation_manager.get_text('count'), 
-                names=translation_manager.get_text('status'),
-                title=translation_manager.get_text('articles_by_citation_status')
+                ),
+                get_text('status'),
+                get_text('count'),
+                get_text('articles_by_citation_status')
             )
             st.plotly_chart(fig, use_container_width=True)
         
         # Contextual tooltip for JSCR
         if fast_metrics.get('JSCR', 0) > 0:
-            with st.expander("🔍 " + translation_manager.get_text('jscr_explanation'), expanded=False):
+            with st.expander("🔍 " + get_text('jscr_explanation'), expanded=False):
                 jscr_info = glossary.get_detailed_info('JSCR')
                 if jscr_info:
-                    st.write(f"**{translation_manager.get_text('current_value')}:** {fast_metrics['JSCR']}%")
-                    st.write(f"**{translation_manager.get_text('interpretation')}:** {jscr_info['interpretation']}")
+                    st.write(f"**{get_text('current_value')}:** {fast_metrics['JSCR']}%")
+                    st.write(f"**{get_text('interpretation')}:** {jscr_info['interpretation']}")
                     
                     # Visual indication
                     jscr_value = fast_metrics['JSCR']
                     if jscr_value < 10:
-                        st.success("✅ " + translation_manager.get_text('low_self_citations_excellent'))
+                        st.success("✅ " + get_text('low_self_citations_excellent'))
                     elif jscr_value < 20:
-                        st.info("ℹ️ " + translation_manager.get_text('moderate_self_citations_normal'))
+                        st.info("ℹ️ " + get_text('moderate_self_citations_normal'))
                     elif jscr_value < 30:
-                        st.warning("⚠️ " + translation_manager.get_text('elevated_self_citations_attention'))
+                        st.warning("⚠️ " + get_text('elevated_self_citations_attention'))
                     else:
-                        st.error("❌ " + translation_manager.get_text('high_self_citations_problems'))
+                        st.error("❌ " + get_text('high_self_citations_problems'))
 
 # =============================================================================
 # 19. OPTIMIZED MAIN ANALYSIS FUNCTION
 # =============================================================================
 
+def show_collected_errors(errors, description):
+    """Show per-DOI errors from a fan-out loop as one collapsed table instead of a widget per error"""
+    if errors:
+        with st.expander(f"⚠️ {len(errors)} {description}", expanded=False):
+            st.dataframe(pd.DataFrame(errors, columns=['DOI', 'Error']), use_container_width=True)
+
+ANALYSIS_RESULTS_TTL = 3600
+
+def analysis_cache_key(issn, period_str, special_analysis, include_ror_data, include_author_id_data):
+    """Key for a finished analysis; special mode uses a date-relative period, so it is keyed by day"""
+    period_key = f"special:{date.today().isoformat()}" if special_analysis else period_str.strip()
+    return ('analysis', issn.strip(), period_key, bool(include_ror_data), bool(include_author_id_data))
+
+# Report files live in their own temp directory so leftovers can be found and pruned
+REPORTS_DIR = os.path.join(tempfile.gettempdir(), "journal_analysis_reports")
+REPORT_FILE_TTL = 24 * 3600
+
+def remove_file_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+def new_report_file(state):
+    """Temp .xlsx for this session's report. It is deleted when the session's state is garbage-collected
+    (i.e. the session ended); files older than REPORT_FILE_TTL, e.g. from a crashed process, are pruned here."""
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+    cutoff = time.time() - REPORT_FILE_TTL
+    for entry in os.scandir(REPORTS_DIR):
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass
+    report_file = tempfile.NamedTemporaryFile(suffix='.xlsx', dir=REPORTS_DIR, delete=False)
+    weakref.finalize(state, remove_file_quietly, report_file.name)
+    return report_file
+
+def release_excel_report(state):
+    """Close and delete the temp file behind the previous report, if any"""
+    if state.excel_buffer is not None and hasattr(state.excel_buffer, 'name'):
+        try:
+            state.excel_buffer.close()
+        except OSError:
+            pass
+        remove_file_quietly(state.excel_buffer.name)
+
+def restore_cached_analysis(state, cache_key):
+    """Load a cached analysis into the session state; returns False when nothing is cached"""
+    try:
+        cached = state.results_cache.get(cache_key)
+    except Exception:
+        cached = None
+    if not cached:
+        return False
+    
+    release_excel_report(state)
+    excel_file = new_report_file(state)
+    excel_file.write(cached['excel_bytes'])
+    excel_file.close()
+    state.excel_buffer = open(excel_file.name, 'rb')
+    state.analysis_results = cached['analysis_results']
+    state.analysis_complete = True
+    return True
+
 def analyze_journal_optimized(issn, period_str, special_analysis=False, include_ror_data=False, include_author_id_data=False):
     """Optimized version of analyze_journal with parallel processing and caching"""
+    state = get_analysis_state()
+    state.analysis_complete = False
+    
+    # Set analysis modes before a cached result is restored, so it is drawn with the same sections
+    state.is_special_analysis = special_analysis
+    state.include_ror_data = include_ror_data
+    state.include_author_id_data = include_author_id_data
+    
+    cache_key = analysis_cache_key(issn, period_str, special_analysis, include_ror_data, include_author_id_data)
+    if restore_cached_analysis(state, cache_key):
+        st.success("⚡ Loaded cached results for this journal and period")
+        return
+    
     global delayer
     delayer = AdaptiveDelayer()
 
@@ -6264,9 +7019,6 @@ def analyze_journal_optimized(issn, period_str, special_analysis=False, include_
     timer_container = st.empty()
     timer_container.info("⏱️ Starting analysis...")
     
-    state = get_analysis_state()
-    state.analysis_complete = False
-    
     # Функция для обновления счетчика общего времени
     def update_timer():
         elapsed_time = time.time() - analysis_start_time
@@ -6286,11 +7038,6 @@ def analyze_journal_optimized(issn, period_str, special_analysis=False, include_
     timer_thread = threading.Thread(target=timer_thread, daemon=True)
     timer_thread.start()
     
-    # Set analysis modes
-    state.is_special_analysis = special_analysis
-    state.include_ror_data = include_ror_data
-    state.include_author_id_data = include_author_id_data
-    
     # Predictive cache warmup
     predictive_cache_warmup(issn)
     
@@ -6346,66 +7093,79 @@ def analyze_journal_optimized(issn, period_str, special_analysis=False, include_
     overall_status.text(translation_manager.get_text('processing_articles'))
     
     analyzed_metadata = []
+    analyzed_dois = []  # DOIs whose metadata loaded successfully, reused for citation collection
     dois = [item.get('DOI') for item in validated_items if item.get('DOI')]
     
     # Use parallel metadata loading
     meta_progress = st.progress(0)
     meta_status = st.empty()
     
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = {executor.submit(parallel_metadata_loading, doi, state): doi for doi in dois}
-        
-        for i, future in enumerate(as_completed(futures)):
-            doi = futures[future]
-            try:
-                result = future.result()
-                analyzed_metadata.append({
-                    'doi': doi,
-                    'crossref': result['crossref'],
-                    'openalex': result['openalex']
-                })
-            except Exception as e:
-                st.error(f"Error processing DOI {doi}: {e}")
-            
-            progress = (i + 1) / len(dois)
-            meta_progress.progress(progress)
-            meta_status.text(f"{translation_manager.get_text('getting_metadata')}: {i + 1}/{len(dois)}")
+    def update_meta_progress(done, total):
+        # Update widgets about every 1% to avoid a websocket message per DOI
+        if done % max(1, total // 100) == 0 or done == total:
+            meta_progress.progress(done / total)
+            meta_status.text(f"{translation_manager.get_text('getting_metadata')}: {done}/{total}")
+    
+    # Async fan-out: one event loop holds all in-flight Crossref/OpenAlex requests
+    metadata_errors = []
+    for doi, result, error in asyncio.run(fetch_all_metadata(dois, state, update_meta_progress)):
+        if error:
+            metadata_errors.append((doi, str(error)))
+            continue
+        analyzed_metadata.append({
+            'doi': doi,
+            'crossref': result['crossref'],
+            'openalex': result['openalex']
+        })
+        analyzed_dois.append(doi)
     
     meta_progress.empty()
     meta_status.empty()
+    show_collected_errors(metadata_errors, "errors while loading article metadata")
     overall_progress.progress(0.6)
     
+    # Analyzed-article stats need only the metadata above, so they are computed while citations download
+    background_executor = ThreadPoolExecutor(max_workers=1)
+    future_analyzed_stats = background_executor.submit(extract_stats_from_metadata, analyzed_metadata, journal_prefix=journal_prefix)
+    background_executor.shutdown(wait=False)
+    
     # PARALLEL: Citing works retrieval and processing
     overall_status.text(translation_manager.get_text('collecting_citations'))
     
     all_citing_metadata = []
-    analyzed_dois = [am['doi'] for am in analyzed_metadata if am.get('doi')]
+    # One record per citing DOI; repeated citation links point at the same dict
+    citing_records = {}
+    # Citing list of each analyzed DOI as collected here, so the analytics see the same citations
+    citings_by_doi = {}
+    citing_errors = []
     
     citing_progress = st.progress(0)
     citing_status = st.empty()
     
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = {executor.submit(get_citing_dois_and_metadata, (doi, state)): doi for doi in analyzed_dois}
-        
-        for i, future in enumerate(as_completed(futures)):
-            doi = futures[future]
-            try:
-                citings = future.result()
-                all_citing_metadata.extend(citings)
-            except Exception as e:
-                st.error(f"Error collecting citations for {doi}: {e}")
-            
-            progress = (i + 1) / len(analyzed_dois)
-            citing_progress.progress(progress)
-            citing_status.text(f"{translation_manager.get_text('collecting_citations_progress')}: {i + 1}/{len(analyzed_dois)}")
+    def update_citing_progress(done, total):
+        if done % max(1, total // 100) == 0 or done == total:
+            citing_progress.progress(done / total)
+            citing_status.text(f"{translation_manager.get_text('collecting_citations_progress')}: {done}/{total}")
+    
+    # Async fan-out, like the metadata step: OpenAlex pages and their Crossref records share one event loop
+    for doi, citings, error in asyncio.run(fetch_all_citing(analyzed_dois, state, update_citing_progress)):
+        if error:
+            citing_errors.append((doi, str(error)))
+        # Keep every citation link for the statistics, but share one record per unique work.
+        # An incomplete list still carries the works fetched before the failure.
+        citings_by_doi[doi] = citings or []
+        for c in citings_by_doi[doi]:
+            c_doi = c.get('doi')
+            all_citing_metadata.append(citing_records.setdefault(c_doi, c) if c_doi else c)
     
     citing_progress.empty()
     citing_status.empty()
+    show_collected_errors(citing_errors, "errors while collecting citations")
     
     # Unique citing works
-    unique_citing_dois = set(c['doi'] for c in all_citing_metadata if c.get('doi'))
-    n_citing = len(unique_citing_dois)
+    n_citing = len(citing_records)
     st.success(translation_manager.get_text('unique_citing_works').format(count=n_citing))
+    analyzed_citings = collect_analyzed_citings(analyzed_metadata, state, citings_by_doi)
     overall_progress.progress(0.7)
     
     # PARALLEL: Statistics and metrics calculation
@@ -6416,10 +7176,9 @@ def analyze_journal_optimized(issn, period_str, special_analysis=False, include_
     stats_status = st.empty()
     
     # Start parallel calculations
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        future_analyzed_stats = executor.submit(extract_stats_from_metadata, analyzed_metadata, journal_prefix=journal_prefix)
+    with ThreadPoolExecutor(max_workers=2) as executor:
         future_citing_stats = executor.submit(extract_stats_from_metadata, all_citing_metadata, is_analyzed=False)
-        future_parallel_metrics = executor.submit(parallel_metrics_calculation, analyzed_metadata, all_citing_metadata, state, issn)
+        future_parallel_metrics = executor.submit(parallel_metrics_calculation, analyzed_metadata, all_citing_metadata, state, issn, analyzed_citings)
         
         # Wait for completion with progress updates
         stats_status.text("Calculating analyzed statistics...")
@@ -6477,8 +7236,11 @@ def analyze_journal_optimized(issn, period_str, special_analysis=False, include_
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f'journal_analysis_{issn}_{timestamp}.xlsx'
     
-    # Create Excel file in memory
-    excel_buffer = io.BytesIO()
+    # Drop the previous report's temp file before writing a new one
+    release_excel_report(state)
+    
+    # Write the Excel file to disk so rows are flushed as they are produced instead of held in RAM
+    excel_buffer = new_report_file(state)
     
     # Prepare data for Excel
     excel_data = {
@@ -6497,7 +7259,7 @@ def analyze_journal_optimized(issn, period_str, special_analysis=False, include_
         'additional': additional_data
     }
     
-    create_enhanced_excel_report(
+    full_report = create_enhanced_excel_report(
         analyzed_metadata, 
         all_citing_metadata, 
         analyzed_stats, 
@@ -6510,8 +7272,9 @@ def analyze_journal_optimized(issn, period_str, special_analysis=False, include_
         additional_data
     )
     
-    excel_buffer.seek(0)
-    state.excel_buffer = excel_buffer
+    excel_buffer.close()
+    # download_button reads file-like objects, so the UI keeps working with a file handle
+    state.excel_buffer = open(excel_buffer.name, 'rb')
 
     excel_end_time = time.time()
     excel_duration = excel_end_time - excel_start_time
@@ -6544,7 +7307,8 @@ def analyze_journal_optimized(issn, period_str, special_analysis=False, include_
         'issn': issn,
         'period': period_str,
         'n_analyzed': n_analyzed,
-        'n_citing': n_citing
+        'n_citing': n_citing,
+        'excel_filename': filename
     }
     
     # Add special analysis metrics to results if available
@@ -6553,6 +7317,18 @@ def analyze_journal_optimized(issn, period_str, special_analysis=False, include_
     
     state.analysis_complete = True
     
+    # Keep the finished analysis so the same request is served from disk next time
+    try:
+        if not full_report:
+            raise ValueError("Excel report is incomplete")
+        with open(excel_buffer.name, 'rb') as f:
+            state.results_cache.set(cache_key, {
+                'analysis_results': state.analysis_results,
+                'excel_bytes': f.read()
+            }, expire=ANALYSIS_RESULTS_TTL)
+    except Exception as e:
+        state.logger.warning(f"Could not cache analysis results: {e}")
+    
     # Clear old caches to free memory
     clear_old_cache()
     
@@ -6647,7 +7423,7 @@ def main_optimized():
         # Dictionary term search widget
         search_term = st.selectbox(
             translation_manager.get_text('select_term_to_learn'),
-            options=[""] + list(glossary.terms.keys()),
+            options=("",) + glossary.term_names,
             format_func=lambda x: translation_manager.get_text('choose_term') if x == "" else f"{x} ({glossary.terms[x]['category']})",
             help=translation_manager.get_text('study_metric_meanings')
         )
@@ -6766,7 +7542,7 @@ def main_optimized():
             st.download_button(
                 label="📥 " + translation_manager.get_text('download_excel_report'),
                 data=state.excel_buffer,
-                file_name=f"journal_analysis_{results['issn']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                file_name=results['excel_filename'],
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                 use_container_width=True
             )